@@ -15,9 +15,7 @@
 URL: https://www.wtfpl.net/txt/copying/
 """
 import asyncio
-import weakref
-from typing import Callable, Dict, List, Any, Optional
-from collections import defaultdict
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
 __all__ = ('EventEmitter',)
 
@@ -31,108 +29,175 @@ class EventEmitter:
     - Automatic cleanup of dead references
     """
 
-    __slots__ = ('_listeners', '_once_listeners', '_max_listeners', '_cleanup_counter')
+    __slots__ = ('_listeners', '_once_listeners', '_max_listeners', '_cleanup_counter',
+                 '_counts')
 
     def __init__(self, max_listeners: int = 100):
-        self._listeners: Dict[str, List[Callable]] = defaultdict(list)
-        self._once_listeners: Dict[str, List[Callable]] = defaultdict(list)
+        self._listeners: Optional[Dict[str, List[Tuple[Callable, bool]]]] = None
+        self._once_listeners: Optional[Dict[str, List[Tuple[Callable, bool]]]] = None
         self._max_listeners = max_listeners
         self._cleanup_counter = 0  
+        self._counts: Optional[Dict[str, int]] = None
 
     def on(self, event: str, listener: Callable) -> None:
         """Register a persistent event listener."""
-        listeners = self._listeners[event]
+        if self._listeners is None:
+            self._listeners = {}
+        listeners = self._listeners.setdefault(event, [])
 
         if len(listeners) >= self._max_listeners:
             return
 
-        listeners.append(listener)
+        listeners.append((listener, asyncio.iscoroutinefunction(listener)))
+        self._adjust_count(event, 1)
 
     def once(self, event: str, listener: Callable) -> None:
         """Register a one-time event listener."""
-        once_listeners = self._once_listeners[event]
+        if self._once_listeners is None:
+            self._once_listeners = {}
+        once_listeners = self._once_listeners.setdefault(event, [])
 
         if len(once_listeners) >= self._max_listeners:
             return
 
-        once_listeners.append(listener)
+        once_listeners.append((listener, asyncio.iscoroutinefunction(listener)))
+        self._adjust_count(event, 1)
 
     def off(self, event: str, listener: Optional[Callable] = None) -> None:
         """Remove listener(s) for an event."""
         if listener is None:
-            self._listeners.pop(event, None)
-            self._once_listeners.pop(event, None)
+            self.remove_all_listeners(event)
         else:
-            if event in self._listeners:
-                try:
-                    self._listeners[event].remove(listener)
-                except ValueError:
-                    pass
-
-            if event in self._once_listeners:
-                try:
-                    self._once_listeners[event].remove(listener)
-                except ValueError:
-                    pass
+            for store in (self._listeners, self._once_listeners):
+                entries = store.get(event) if store else None
+                if entries:
+                    before = len(entries)
+                    entries[:] = [e for e in entries if e[0] != listener]
+                    self._adjust_count(event, len(entries) - before)
+
+    def _adjust_count(self, event: str, delta: int) -> None:
+        """Keep the per-event listener total in sync with registrations."""
+        counts = self._counts
+        if counts is None:
+            if delta <= 0:
+                return
+            counts = self._counts = {}
+        count = counts.get(event, 0) + delta
+        if count > 0:
+            counts[event] = count
+        else:
+            counts.pop(event, None)
 
     def emit(self, event: str, *args: Any, **kwargs: Any) -> None:
         """
         Emit an event to all registered listeners.
         Async listeners are scheduled without blocking.
         """
-        if event not in self._listeners and event not in self._once_listeners:
+        store = self._listeners
+        once_store = self._once_listeners
+        if store is None and once_store is None:
             return
 
-        listeners = self._listeners.get(event, [])
-        self._dispatch_to_listeners(listeners, args, kwargs)
+        listeners = store.get(event) if store else None
+        once_listeners = once_store.pop(event, None) if once_store else None
+
+        if not listeners and not once_listeners:
+            return
 
-        once_listeners = self._once_listeners.pop(event, [])
-        if once_listeners:
-            self._dispatch_to_listeners(once_listeners, args, kwargs)
+        if once_listeners is None and len(listeners) == 1:
+            listener, is_coro = listeners[0]
+            try:
+                if is_coro:
+                    self._schedule_coro(listener(*args, **kwargs))
+                else:
+                    listener(*args, **kwargs)
+            except Exception:
+                pass
+        else:
+            if once_listeners:
+                self._adjust_count(event, -len(once_listeners))
+                snapshot = tuple(listeners) + tuple(once_listeners) if listeners else tuple(once_listeners)
+            else:
+                snapshot = tuple(listeners)
+            self._dispatch_to_listeners(snapshot, args, kwargs)
 
         self._cleanup_counter += 1
         if self._cleanup_counter >= 100:
             self._cleanup_counter = 0
             self._cleanup_empty_events()
 
-    def _dispatch_to_listeners(self, listeners: List[Callable], args: tuple, kwargs: dict) -> None:
+    def emit_sync(self, event: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Emit a high-frequency event without the once/cleanup bookkeeping.
+        Falls back to emit() when one-time listeners are registered.
+        """
+        once_store = self._once_listeners
+        if once_store and event in once_store:
+            self.emit(event, *args, **kwargs)
+            return
+
+        store = self._listeners
+        listeners = store.get(event) if store else None
+        if not listeners:
+            return
+
+        for listener, is_coro in tuple(listeners):
+            try:
+                if is_coro:
+                    self._schedule_coro(listener(*args, **kwargs))
+                else:
+                    listener(*args, **kwargs)
+            except Exception:
+                pass
+
+    def _dispatch_to_listeners(self, listeners: Tuple[Tuple[Callable, bool], ...], args: tuple, kwargs: dict) -> None:
         """Dispatch event to a list of listeners without blocking."""
-        for listener in listeners:
+        for listener, is_coro in listeners:
             try:
-                if asyncio.iscoroutinefunction(listener):
-                    try:
-                        asyncio.create_task(listener(*args, **kwargs))
-                    except RuntimeError:
-                        pass
+                if is_coro:
+                    self._schedule_coro(listener(*args, **kwargs))
                 else:
                     listener(*args, **kwargs)
             except Exception:
                 pass
 
+    @staticmethod
+    def _schedule_coro(coro) -> None:
+        """Start a listener coroutine; without a running loop it is closed instead of leaked."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            coro.close()
+            return
+        loop.create_task(coro)
+
     def _cleanup_empty_events(self) -> None:
         """Remove event keys with no listeners (memory optimization)."""
-        empty = [k for k, v in self._listeners.items() if not v]
-        for k in empty:
-            del self._listeners[k]
-
-        empty = [k for k, v in self._once_listeners.items() if not v]
-        for k in empty:
-            del self._once_listeners[k]
+        for store in (self._listeners, self._once_listeners):
+            if store:
+                empty = [k for k, v in store.items() if not v]
+                for k in empty:
+                    del store[k]
 
     def remove_all_listeners(self, event: Optional[str] = None) -> None:
         """Remove all listeners for a specific event or all events."""
         if event is None:
-            self._listeners.clear()
-            self._once_listeners.clear()
+            self._listeners = None
+            self._once_listeners = None
+            self._counts = None
         else:
-            self._listeners.pop(event, None)
-            self._once_listeners.pop(event, None)
+            if self._listeners:
+                self._listeners.pop(event, None)
+            if self._once_listeners:
+                self._once_listeners.pop(event, None)
+            if self._counts:
+                self._counts.pop(event, None)
 
     def listener_count(self, event: str) -> int:
         """Get the number of listeners for an event."""
-        return (len(self._listeners.get(event, [])) +
-                len(self._once_listeners.get(event, [])))
+        counts = self._counts
+        return counts.get(event, 0) if counts else 0
 
     def event_names(self) -> List[str]:
         """Get list of all events with listeners."""
-        return list(set(list(self._listeners.keys()) + list(self._once_listeners.keys())))
+        return list(self._counts) if self._counts else []
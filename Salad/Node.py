@@ -16,29 +16,63 @@ URL: https://www.wtfpl.net/txt/copying/
 """
 import aiohttp
 import asyncio
-from typing import Dict, Optional, Any
+from multidict import CIMultiDict
+import random
+import struct
+import sys
+from typing import Dict, Optional, Any, Set, Tuple, Coroutine
 import logging
 from .Lyrics import Lyrics
+from .Rest import Rest, RequestTimeout
 from .Autoplay import sc_autoplay, sp_autoplay, yt_autoplay
 from .models.tracks import AudioTrack
 
 try:
     import orjson as json
     dumps = lambda x: json.dumps(x).decode('utf-8')
+    dumpb = json.dumps
     loads = json.loads
 except ImportError:
     try:
         import ujson as json
         dumps = json.dumps
+        dumpb = lambda x: json.dumps(x).encode('utf-8')
         loads = json.loads
     except ImportError:
         import json
         dumps = json.dumps
+        dumpb = lambda x: json.dumps(x).encode('utf-8')
         loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 WS_PATH = 'v4/websocket'
+TEXT = aiohttp.WSMsgType.TEXT
+BINARY = aiohttp.WSMsgType.BINARY
+MSG_QUEUE_SIZE = 1024
+# Ops superseded by the next one of the same kind; safe to drop under backpressure
+DROPPABLE_OPS = frozenset(('stats', 'playerUpdate'))
+BINARY_PLAYER_UPDATE = struct.Struct('<QqQ')
+# Lavalink v4 sends camelCase reasons ('loadFailed'), v3 sent 'LOAD_FAILED'
+TRACK_END_ADVANCE = frozenset(('finished', 'loadfailed', 'load_failed'))
+TRACK_END_IGNORE = frozenset(('replaced',))
+
+def _guildId(raw: Any) -> Optional[int]:
+    """Normalize a Lavalink guildId (sent as a string) to the int player key."""
+    if type(raw) is int:
+        return raw
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return None
+
+def _asInt(value: Any) -> int:
+    """Coerce a non-int numeric state field, defaulting to 0."""
+    if isinstance(value, float):
+        return int(value)
+    return 0
 
 class Node:
     """Optimized Lavalink node with connection pooling and circuit breaker."""
@@ -50,8 +84,12 @@ class Node:
         '_reconnect_attempts', '_max_reconnect_attempts', '_infinite_reconnect',
         '_reconnecting', '_base_reconnect_delay', '_max_reconnect_delay',
         '_circuit_breaker_threshold', '_circuit_breaker_failures',
-        '_circuit_open_until', '_msg_buffer',
-        'spotify_client_id', 'spotify_client_secret', 'lyrics'
+        '_circuit_open_until', '_msg_queue', '_consumerTask',
+        'spotify_client_id', 'spotify_client_secret', 'lyrics',
+        '_baseUri', '_playersUri', '_jsonHeaders', '_eventHandlers',
+        '_readyEvent', '_pendingTasks', '_binaryUpdates', '_pendingPositions',
+        '_resolveSem', '_resumeTimeout', '_resumeSessionId', 'resumed',
+        '_reconnectTask', '_closing'
     )
 
     def __init__(self, salad, connOpts: Dict, opts: Optional[Dict] = None):
@@ -63,6 +101,8 @@ class Node:
         self.spotify_client_id = connOpts.get('spotify_client_id')
         self.spotify_client_secret = connOpts.get('spotify_client_secret')
         self.wsUrl = f"ws{'s' if self.ssl else ''}://{self.host}:{self.port}/{WS_PATH}"
+        self._baseUri = f"http{'s' if self.ssl else ''}://{self.host}:{self.port}"
+        self._playersUri: Optional[str] = None
         self.opts = opts or {}
         self.connected = False
         self.info: Optional[Dict] = None
@@ -74,11 +114,12 @@ class Node:
         self.stats: Optional[Dict] = None
         self._listenTask: Optional[asyncio.Task] = None
 
-        self.headers = {
+        self.headers = CIMultiDict({
             'Authorization': self.auth,
             'User-Id': '',
             'Client-Name': self.clientName
-        }
+        })
+        self._jsonHeaders = self._buildJsonHeaders()
 
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = opts.get('maxReconnectAttempts', 5) if opts else 5
@@ -89,15 +130,32 @@ class Node:
         self._circuit_breaker_threshold = 5
         self._circuit_breaker_failures = 0
         self._circuit_open_until = 0
-        self._msg_buffer = []
+        self._msg_queue: Optional[asyncio.Queue] = None
+        self._consumerTask: Optional[asyncio.Task] = None
+        self._readyEvent: Optional[asyncio.Event] = None
+        self._pendingTasks: Set[asyncio.Task] = set()
+        self._reconnectTask: Optional[asyncio.Task] = None
+        self._closing = False
+        self._binaryUpdates = self.opts.get('binaryPlayerUpdates', False)
+        self._pendingPositions: Dict[int, Tuple[Any, Dict]] = {}
+        self._resolveSem = asyncio.Semaphore(self.opts.get('maxConcurrentResolves', 32))
+        self._resumeTimeout: int = self.opts.get('resumeTimeout', 0)
+        self._resumeSessionId: Optional[str] = connOpts.get('resumeSessionId')
+        self.resumed = False
+
+        self._eventHandlers = {
+            sys.intern('TrackEndEvent'): self._handleTrackEnd,
+            sys.intern('TrackStuckEvent'): self._handleTrackError,
+            sys.intern('TrackExceptionEvent'): self._handleTrackError,
+            sys.intern('WebSocketClosedEvent'): self._handleWsClosed,
+        }
 
-        from .Rest import Rest
         self.rest = Rest(salad, self)
         self.lyrics = Lyrics(self) if self.spotify_client_id and self.spotify_client_secret else None
 
     async def connect(self) -> None:
         """Connect with circuit breaker protection."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         now = loop.time()
 
         if self._circuit_open_until > now:
@@ -108,25 +166,48 @@ class Node:
         try:
             if not self.session or self.session.closed:
                 timeout = aiohttp.ClientTimeout(total=30, connect=10)
+                conn = aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True
+                )
                 self.session = aiohttp.ClientSession(
+                    connector=conn,
                     timeout=timeout,
                     json_serialize=dumps
                 )
+                self.rest.session = self.session
+
+            # drop the previous session so a reconnect waits for the new ready op
+            self._setSessionId(None)
+
+            wsHeaders = self.headers
+            resumeId = self._resumeSessionId if self._resumeTimeout else None
+            if self._binaryUpdates or resumeId:
+                wsHeaders = CIMultiDict(wsHeaders)
+                if self._binaryUpdates:
+                    wsHeaders['Supports-Binary-PlayerUpdate'] = 'true'
+                if resumeId:
+                    wsHeaders['Session-Id'] = resumeId
 
             self.ws = await self.session.ws_connect(
                 self.wsUrl,
-                headers=self.headers,
+                headers=wsHeaders,
                 autoclose=False,
                 heartbeat=30,
                 compress=15
             )
 
             self.connected = True
-            self._reconnect_attempts = 0
-            self._reconnecting = False
-            self._circuit_breaker_failures = 0
-            self._circuit_open_until = 0
 
+            self._readyEvent = asyncio.Event()
+
+            if self._consumerTask and not self._consumerTask.done():
+                self._consumerTask.cancel()
+            self._msg_queue = asyncio.Queue(maxsize=MSG_QUEUE_SIZE)
+            self._consumerTask = asyncio.create_task(self._consumeMsgs(self._msg_queue))
             self._listenTask = asyncio.create_task(self._listenWs())
 
             try:
@@ -135,7 +216,20 @@ class Node:
                 logger.error("Timeout waiting for session ID")
                 raise
 
-            resp = await self.rest.makeRequest('GET', 'v4/info')
+            self._reconnect_attempts = 0
+            self._reconnecting = False
+            self._circuit_breaker_failures = 0
+            self._circuit_open_until = 0
+
+            if self._resumeTimeout:
+                if await self.updateSession(resuming=True, timeout=self._resumeTimeout) is None:
+                    logger.warning(f"Failed to enable session resuming for {self.sessionId}")
+                    self.salad.emit('nodeError', self, Exception('Session resume configuration failed'))
+
+            try:
+                resp = await self.rest.makeRequest('GET', 'v4/info')
+            except RequestTimeout:
+                resp = None
             if isinstance(resp, dict):
               self.info = resp
 
@@ -146,16 +240,15 @@ class Node:
             self._circuit_breaker_failures += 1
 
             if self._circuit_breaker_failures >= self._circuit_breaker_threshold:
-                self._circuit_open_until = loop.time() + 60.0  
+                self._circuit_open_until = loop.time() + 60.0
                 logger.error(f"Circuit breaker opened after {self._circuit_breaker_failures} failures")
 
             await self._cleanup()
             self.salad.emit('nodeError', self, e)
 
     async def _waitForSession(self) -> None:
-        """Wait for session ID with async polling."""
-        while not self.sessionId:
-            await asyncio.sleep(0.05)
+        """Wait until the ready op delivers a session ID."""
+        await self._readyEvent.wait()
 
     async def _listenWs(self) -> None:
         """Optimized WebSocket listener with batch processing."""
@@ -163,13 +256,29 @@ class Node:
             if not self.ws:
                 return
 
+            queue = self._msg_queue
+            binaryUpdates = self._binaryUpdates
+            binarySize = BINARY_PLAYER_UPDATE.size
+            unpackBinary = BINARY_PLAYER_UPDATE.unpack
             async for msg in self.ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
+                msgType = msg.type
+                if msgType is TEXT or msgType is BINARY:
                     try:
-                        data = loads(msg.data)
-                        asyncio.create_task(self._handleWsMsg(data))
+                        raw = msg.data
+                        if binaryUpdates and msgType is BINARY and len(raw) == binarySize:
+                            data = unpackBinary(raw)
+                        else:
+                            data = loads(raw)
                     except Exception as e:
                         logger.debug(f"WS parse error: {e}")
+                        continue
+
+                    try:
+                        queue.put_nowait(data)
+                    except asyncio.QueueFull:
+                        if type(data) is tuple or data.get('op') in DROPPABLE_OPS:
+                            continue
+                        await queue.put(data)
 
                 elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSE):
                     break
@@ -184,7 +293,7 @@ class Node:
             if was_connected and hasattr(self.salad, 'state_manager') and self.salad.state_manager:
                 for guild_id in self.players:
                     self.salad.state_manager.mark_dirty(guild_id)
-                asyncio.create_task(self.salad.state_manager.save_all_states())
+                self._spawn(self.salad.state_manager.save_all_states())
 
             self.salad.emit('nodeDisconnect', self)
 
@@ -193,9 +302,28 @@ class Node:
                 self._reconnect_attempts < self._max_reconnect_attempts
             )
 
-            if should_reconnect and not self._reconnecting:
+            if should_reconnect and not self._reconnecting and not self._closing:
                 self._reconnecting = True
-                asyncio.create_task(self._attemptReconnect())
+                self._reconnectTask = self._spawn(self._attemptReconnect())
+
+    def _spawn(self, coro: Coroutine) -> asyncio.Task:
+        """Schedule a background task and hold a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._pendingTasks.add(task)
+        task.add_done_callback(self._pendingTasks.discard)
+        return task
+
+    async def _consumeMsgs(self, queue: asyncio.Queue) -> None:
+        """Drain parsed WebSocket messages in order on a single task."""
+        while True:
+            data = await queue.get()
+            try:
+                if type(data) is tuple:
+                    self._handleBinaryPlayerUpdate(*data)
+                else:
+                    self._handleWsMsg(data)
+            except Exception as e:
+                logger.debug(f"WS handler error: {e}")
 
     async def _attemptReconnect(self) -> None:
         """Reconnect with exponential backoff and jitter."""
@@ -212,7 +340,7 @@ class Node:
                 try:
                     await self.connect()
                     if self.connected and self.sessionId:
-                        asyncio.create_task(self._restore_players())
+                        self._spawn(self._restore_players())
                         return
                 except Exception as e:
                     logger.debug(f"Reconnect failed: {e}")
@@ -226,10 +354,8 @@ class Node:
         if attempt == 0:
             return self._base_reconnect_delay
 
-        import random
-        exponential = self._base_reconnect_delay * (2 ** (attempt - 1))
-        jitter = random.uniform(0.75, 1.25)
-        return min(exponential * jitter, self._max_reconnect_delay)
+        exponential = min(self._base_reconnect_delay * (2 ** (attempt - 1)), self._max_reconnect_delay)
+        return exponential * (0.5 + random.random() * 0.5)
 
     async def _restore_players(self) -> None:
         """Restore players after reconnection."""
@@ -245,99 +371,145 @@ class Node:
         except Exception as e:
             logger.error(f"Player restore failed: {e}")
 
-    async def _handleWsMsg(self, data: Dict) -> None:
+    def _handleWsMsg(self, data: Dict) -> None:
         """Fast-path message handler."""
-        op = data.get('op')
-
-        if op == 'ready':
-            self.sessionId = data.get('sessionId')
-            self.salad.emit('nodeReady', self, data)
-
-        elif op == 'stats':
-            self.stats = data
-            self.salad.emit('nodeStats', self, data)
-
-        elif op == 'playerUpdate':
-            gid = data.get('guildId')
-            if isinstance(gid, str):
-                try:
-                    gid = int(gid)
-                except ValueError:
-                    return
-
-            player = self.players.get(gid or 0)
-            if player:
-                state = data.get('state', {})
-                player.position = state.get('position', 0)
-                player.timestamp = state.get('time', 0)
-
-                if hasattr(self.salad, 'state_manager') and self.salad.state_manager:
-                    self.salad.state_manager.mark_dirty(gid)
-
-                self.salad.emit('playerPositionUpdate', player, state)
-
-        elif op == 'event':
-            asyncio.create_task(self._handleEvent(data))
-
-    async def _handleEvent(self, data: Dict) -> None:
-        """Handle Lavalink events."""
-        gid = data.get('guildId')
-        evType = data.get('type')
-
-        if not gid:
-            return
-
-        if isinstance(gid, str):
-            try:
-                gid = int(gid)
-            except ValueError:
-                return
-
+        handler = _OP_HANDLERS.get(data.get('op'))
+        if handler:
+            handler(self, data)
+
+    def _onReady(self, data: Dict) -> None:
+        """Handle the ready op."""
+        sid = data.get('sessionId')
+        self.resumed = bool(data.get('resumed'))
+        if sid:
+            self._resumeSessionId = sid
+        self._setSessionId(sid)
+        self.salad.emit('nodeReady', self, data)
+        if self.resumed:
+            self.salad.emit('nodeResumed', self)
+
+    def _onStats(self, data: Dict) -> None:
+        """Handle the stats op."""
+        self.stats = data
+        self.salad.emit('nodeStats', self, data)
+
+    def _onPlayerUpdate(self, data: Dict) -> None:
+        """Handle the playerUpdate op."""
+        gid = _guildId(data.get('guildId'))
+        player = self.players.get(gid)
+        if player:
+            state = data.get('state', {})
+            position = state.get('position')
+            timestamp = state.get('time')
+            ping = state.get('ping')
+            player.position = position if type(position) is int else _asInt(position)
+            player.timestamp = timestamp if type(timestamp) is int else _asInt(timestamp)
+            if ping is not None:
+                player.ping = ping if type(ping) is int else _asInt(ping)
+
+            state_manager = self.salad.state_manager
+            if state_manager:
+                state_manager.mark_dirty(gid)
+
+            self._queuePositionUpdate(gid, player, state)
+
+    def _handleBinaryPlayerUpdate(self, gid: int, position: int, timestamp: int) -> None:
+        """Handle an unpacked (guildId, position, time) player update frame."""
+        player = self.players.get(gid)
+        if player:
+            player.position = position
+            player.timestamp = timestamp
+
+            state_manager = self.salad.state_manager
+            if state_manager:
+                state_manager.mark_dirty(gid)
+
+            self._queuePositionUpdate(gid, player, {'position': position, 'time': timestamp})
+
+    def _queuePositionUpdate(self, gid: int, player: Any, state: Dict) -> None:
+        """Buffer a position update; only the latest per guild is emitted each tick."""
+        pending = self._pendingPositions
+        pending[gid] = (player, state)
+        if len(pending) == 1:
+            asyncio.get_running_loop().call_soon(self._flushPositions)
+
+    def _flushPositions(self) -> None:
+        """Emit the buffered position updates in one pass."""
+        pending = self._pendingPositions
+        self._pendingPositions = {}
+        emit = self.salad.emit_sync
+        for player, state in pending.values():
+            if not player.destroyed:
+                emit('playerPositionUpdate', player, state)
+
+    def _onEvent(self, data: Dict) -> None:
+        """Handle the event op, resolving the player before scheduling."""
+        gid = _guildId(data.get('guildId'))
         player = self.players.get(gid)
         if not player:
             return
 
-        if hasattr(self.salad, 'state_manager') and self.salad.state_manager:
-            self.salad.state_manager.mark_dirty(gid)
+        state_manager = self.salad.state_manager
+        if state_manager:
+            state_manager.mark_dirty(gid)
+
+        handler = self._eventHandlers.get(data.get('type'))
+        if handler:
+            self._spawn(handler(player, data))
 
-        if evType == 'TrackEndEvent':
-            await self._handleTrackEnd(player, data)
-        elif evType in ('TrackStuckEvent', 'TrackExceptionEvent'):
-            await self._handleTrackError(player, data)
-        elif evType == 'WebSocketClosedEvent':
-            self.salad.emit('playerWebSocketClosed', player, data)
+    async def _handleWsClosed(self, player, data: Dict) -> None:
+        """Handle voice WebSocket closed events."""
+        self.salad.emit('playerWebSocketClosed', player, data)
 
     async def _handleTrackEnd(self, player, data: Dict) -> None:
         """Handle track end with proper queue management."""
         reason = data.get('reason', 'UNKNOWN').lower()
 
-        if reason in ('finished', 'load_failed'):
-            if player.queue.loop != 'track':
-                consumed = player.queue.consumeNext()
+        emit = self.salad.emit
+
+        skipped = player._skippedTrack
+        if reason == 'stopped' and skipped is not None:
+            encoded = (data.get('track') or {}).get('encoded')
+            if encoded is None or encoded == skipped[0]:
+                # skip() stopped this track and advances the queue itself, even if this arrives late
+                player._skippedTrack = None
+                waiter = player._trackEndWaiter
+                if waiter is not None and not waiter.done():
+                    player._trackEndWaiter = None
+                    waiter.set_result(reason)
+                emit('trackEnd', player, skipped[1], reason)
+                return
+
+        queue = player.queue
+        notTrackLoop = queue.loop != 'track'
+
+        if reason in TRACK_END_ADVANCE:
+            if notTrackLoop:
+                consumed = queue.consumeNext()
                 player.current = None
                 player.currentTrackObj = None
-                self.salad.emit('trackEnd', player, consumed, reason)
+                emit('trackEnd', player, consumed, reason)
 
             player.playing = False
             player.position = 0
 
-            if player.queue._q or player.queue.loop == 'track':
-                asyncio.create_task(player.play())
+            if queue._q or not notTrackLoop:
+                self._spawn(player.play())
             else:
                 if player.autoplay:
                     await self._handle_autoplay(player)
                 else:
                     player.current = None
                     player.currentTrackObj = None
-                    self.salad.emit('queueEnd', player)
+                    emit('queueEnd', player)
 
-        elif reason == 'replaced':
+        elif reason in TRACK_END_IGNORE:
             pass
 
         else:
-            if player.queue.loop != 'track':
-                consumed = player.queue.consumeNext()
-                self.salad.emit('trackEnd', player, consumed, reason)
+            if notTrackLoop:
+                consumed = queue.consumeNext()
+                emit('trackEnd', player, consumed, reason)
 
             player.current = None
             player.currentTrackObj = None
@@ -345,7 +517,8 @@ class Node:
 
     async def _handleTrackError(self, player, data: Dict) -> None:
         """Handle track errors."""
-        consumed = player.queue.consumeNext() if player.queue.loop != 'track' else player.currentTrackObj
+        queue = player.queue
+        consumed = queue.consumeNext() if queue.loop != 'track' else player.currentTrackObj
 
         player.current = None
         player.currentTrackObj = None
@@ -353,37 +526,74 @@ class Node:
 
         self.salad.emit('trackError', player, consumed, data)
 
-        if player.queue._q and not player.destroyed:
-            asyncio.create_task(player.play())
+        if queue._q and not player.destroyed:
+            self._spawn(player.play())
+
+    def _setSessionId(self, sid: Optional[str]) -> None:
+        """Set session ID and rebuild the cached players URI."""
+        self.sessionId = sid
+        self._playersUri = f"{self._baseUri}/v4/sessions/{sid}/players/" if sid else None
+
+        event = self._readyEvent
+        if event:
+            if sid:
+                event.set()
+            else:
+                event.clear()
+
+    async def updateSession(self, *, resuming: bool, timeout: Optional[int] = None) -> Optional[Dict]:
+        """
+        Configure Lavalink session resuming.
+
+        Args:
+            resuming: Whether Lavalink should keep the session after a disconnect
+            timeout: Seconds Lavalink waits for the client to resume
+
+        Returns:
+            dict: The updated session, or None if the request failed
+        """
+        if not self.sessionId:
+            return None
+
+        data: Dict[str, Any] = {'resuming': resuming}
+        if timeout is not None:
+            data['timeout'] = timeout
+        try:
+            return await self.rest.makeRequest('PATCH', f'v4/sessions/{self.sessionId}', data)
+        except RequestTimeout:
+            logger.debug("Session update timed out")
+            return None
 
     def updateClientId(self, cid: str) -> None:
         """Update client ID."""
         self.headers['User-Id'] = str(cid)
-        if self.rest:
-            self.rest.headers.update(self.headers)
+        self._jsonHeaders = self._buildJsonHeaders()
+
+    def _buildJsonHeaders(self) -> CIMultiDict:
+        """Copy the node headers with a JSON content type."""
+        headers = CIMultiDict(self.headers)
+        headers['Content-Type'] = 'application/json'
+        headers['Accept-Encoding'] = 'identity'
+        return headers
 
     async def _updatePlayer(self, gid: int, /, *, data: Dict, replace: bool = False) -> Optional[Dict]:
         """Update player state with connection pooling."""
-        noReplace = not replace
-        scheme = 'https' if self.ssl else 'http'
-        uri = (f"{scheme}://{self.host}:{self.port}/v4/sessions/"
-               f"{self.sessionId}/players/{gid}?noReplace={str(noReplace).lower()}")
+        if not self.session or self.session.closed or not self._playersUri:
+            raise Exception('Node session is not available')
 
-        if not self.session or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self.session = aiohttp.ClientSession(timeout=timeout, json_serialize=dumps)
+        uri = f"{self._playersUri}{gid}?noReplace={'false' if replace else 'true'}"
 
-        json_data = dumps(data).encode('utf-8') if isinstance(dumps(data), str) else dumps(data)
-        headers = {**self.headers, 'Content-Type': 'application/json'}
+        json_data = dumpb(data)
 
         try:
-            async with self.session.patch(uri, data=json_data, headers=headers) as resp:
-                if resp.status in (200, 201):
+            async with self.session.patch(uri, data=json_data, headers=self._jsonHeaders) as resp:
+                status = resp.status
+                if status == 204:
+                    return None
+                if status in (200, 201):
                     body = await resp.read()
                     return loads(body) if body else None
-                if resp.status == 204:
-                    return None
-                raise Exception(f"Player update failed: {resp.status}")
+                raise Exception(f"Player update failed: {status}")
         except Exception as e:
             logger.debug(f"Player update error: {e}")
             raise
@@ -424,17 +634,41 @@ class Node:
             logger.error(f"Autoplay failed: {e}")
             self.salad.emit('queueEnd', player)
 
-    async def _cleanup(self) -> None:
-        """Cleanup resources."""
-        if self._listenTask and not self._listenTask.done():
-            self._listenTask.cancel()
+    async def _stopReconnect(self) -> None:
+        """Stop any reconnect loop and keep a closing socket from starting one."""
+        self._closing = True
+        task = self._reconnectTask
+        self._reconnectTask = None
+        if task and not task.done():
+            task.cancel()
             try:
-                await self._listenTask
+                await task
             except asyncio.CancelledError:
                 pass
+        self._reconnecting = False
+
+    async def _cleanup(self) -> None:
+        """Cleanup resources."""
+        for task in (self._listenTask, self._consumerTask):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        self._msg_queue = None
 
         if self.ws and not self.ws.closed:
             await self.ws.close()
 
         self.connected = False
-        self.sessionId = None
+        self._setSessionId(None)
+
+
+_OP_HANDLERS = {
+    sys.intern('ready'): Node._onReady,
+    sys.intern('stats'): Node._onStats,
+    sys.intern('playerUpdate'): Node._onPlayerUpdate,
+    sys.intern('event'): Node._onEvent,
+}
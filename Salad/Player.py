@@ -14,10 +14,10 @@
 
 URL: https://www.wtfpl.net/txt/copying/
 """
-from typing import Optional, Dict, Any, Callable, TYPE_CHECKING
+from typing import Optional, Dict, Any, Callable, Tuple, TYPE_CHECKING
 import asyncio
-import aiohttp
 import logging
+import weakref
 from .Queue import Queue
 
 if TYPE_CHECKING:
@@ -26,26 +26,34 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Shared stop payload; _updatePlayer only serializes it, never mutate.
+_STOP_PAYLOAD: Dict[str, Any] = {'encodedTrack': None}
+
 
 class NullQueue:
-    """No-op queue for destroyed players."""
+    """No-op queue for destroyed players, shared as a single instance."""
     __slots__ = ('_q', 'loop')
 
     def __init__(self, player=None):
-        self._q = []
+        self._q = ()
         self.loop = None
 
     def add(self, item): return bool(self)
+    def extend(self, tracks): return 0
     def insert(self, item, idx=0): return None
-    def clear(self): self._q.clear()
+    def clear(self): return None
     def getNext(self): return None
     def consumeNext(self): return None
     def getAll(self): return []
     def __len__(self): return 0
+    def __bool__(self): return False
     @property
     def queue(self): return []
 
 
+_NULL_QUEUE = NullQueue()
+
+
 class Player:
     """Optimized player with built-in Discord voice state management."""
 
@@ -53,17 +61,25 @@ class Player:
         'salad', 'nodes', 'guildId', 'voiceChannel', 'textChannel',
         'mute', 'deaf', 'playing', 'destroyed', 'current',
         'currentTrackObj', 'position', 'timestamp', 'ping',
-        'connected', 'volume', '_voiceState', '_lastVoiceUpdate',
-        'paused', 'queue', '_playLock', '_voiceUpdateTask',
+        'connected', 'volume', '_voiceSessionId', '_voiceToken',
+        '_voiceEndpoint', '_voiceReady', '_lastVoiceUpdateKey',
+        'paused', 'queue', '_playInFlight', '_voiceUpdateTask',
         '_destroying', '_voiceCleanupCallback', '_trackEndHandled',
         '_kickCheckTask', '_lastVoiceChannelId', '_voice_client', 'autoplay',
-        '__weakref__'
+        '_emit', '_nodeUpdate', '_voiceWake', '_voiceDirty',
+        '_pendingUpdate', '_pendingUpdateWaiter', '_updateFlushTask',
+        '_trackEndWaiter', '_skippedTrack', '_connectedEvent', '__weakref__'
     )
 
+    _configuredLoops: 'weakref.WeakSet' = weakref.WeakSet()
+    _PLAY_TEMPLATE: Dict[str, Any] = {'position': 0, 'paused': False}
+
     def __init__(self, salad, nodes: 'Node', opts: Optional[Dict] = None):
         opts = opts or {}
         self.salad = salad
         self.nodes = nodes
+        self._emit = salad.emit
+        self._nodeUpdate = nodes._updatePlayer
         self.guildId: Optional[int] = opts.get('guildId')
         self.voiceChannel: Optional[str] = opts.get('voiceChannel')
         self.textChannel: Optional[str] = opts.get('textChannel')
@@ -80,11 +96,22 @@ class Player:
         self.volume: int = opts.get('volume', 100)
         self.paused: bool = False
         self.autoplay: bool = False
-        self._voiceState: Dict = {'voice': {}}
-        self._lastVoiceUpdate: Dict = {}
+        self._voiceSessionId: Optional[str] = None
+        self._voiceToken: Optional[str] = None
+        self._voiceEndpoint: Optional[str] = None
+        self._voiceReady: bool = False
+        self._lastVoiceUpdateKey: Optional[Tuple[str, str, str]] = None
         self.queue = Queue(self)
-        self._playLock = asyncio.Lock()
+        self._playInFlight: bool = False
         self._voiceUpdateTask: Optional[asyncio.Task] = None
+        self._voiceWake: Optional[asyncio.Event] = None
+        self._voiceDirty: int = 0
+        self._pendingUpdate: Optional[Dict[str, Any]] = None
+        self._pendingUpdateWaiter: Optional[asyncio.Future] = None
+        self._updateFlushTask: Optional[asyncio.Task] = None
+        self._trackEndWaiter: Optional[asyncio.Future] = None
+        self._skippedTrack: Optional[Tuple[str, Any]] = None
+        self._connectedEvent: Optional[asyncio.Event] = None
         self._destroying: bool = False
         self._trackEndHandled: bool = False
         self._voiceCleanupCallback: Optional[Callable] = None
@@ -92,6 +119,20 @@ class Player:
         self._lastVoiceChannelId: Optional[str] = None
         self._voice_client: Optional[Any] = None
 
+        if salad.opts.get('eagerTasks', False):
+            self._configureLoop()
+
+    def _configureLoop(self) -> None:
+        """Install the eager task factory once per event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        if loop not in Player._configuredLoops:
+            self.salad.configure_loop(loop)
+            Player._configuredLoops.add(loop)
+
     def setVoiceCleanupCallback(self, callback: Callable) -> None:
         """Set voice cleanup callback."""
         self._voiceCleanupCallback = callback
@@ -124,10 +165,58 @@ class Player:
 
         return None
 
+    def _markConnected(self) -> None:
+        """Flag the player connected and wake waitForConnection() callers."""
+        self.connected = True
+        if self._connectedEvent is not None:
+            self._connectedEvent.set()
+
+    async def waitForConnection(self, timeout: float = 15.0) -> bool:
+        """
+        Wait until the player is connected to voice.
+
+        Args:
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            bool: True if connected within the timeout
+        """
+        if self.connected:
+            return True
+
+        event = self._connectedEvent
+        if event is None or event.is_set():
+            event = self._connectedEvent = asyncio.Event()
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.connected
+
     def isVoiceReady(self) -> bool:
         """Check if voice ready."""
-        vd = self._voiceState.get('voice', {})
-        return bool(vd.get('session_id') and vd.get('token') and vd.get('endpoint'))
+        return self._voiceReady
+
+    def _refreshVoiceReady(self) -> None:
+        """Recompute the cached readiness after a voice field changes."""
+        self._voiceReady = bool(self._voiceSessionId and self._voiceToken and self._voiceEndpoint)
+
+    def _resetVoiceState(self) -> None:
+        """Forget the Discord voice session, token and endpoint."""
+        self._voiceSessionId = None
+        self._voiceToken = None
+        self._voiceEndpoint = None
+        self._voiceReady = False
+
+    def _resetPlaybackState(self) -> None:
+        """Clear the current track and playback/connection flags."""
+        self.current = None
+        self.currentTrackObj = None
+        self.position = 0
+        self.playing = False
+        self.paused = False
+        self.connected = False
 
     async def connect(self, opts: Optional[Dict] = None) -> None:
         """
@@ -142,16 +231,11 @@ class Player:
         if self.destroyed:
             self.destroyed = False
             self._destroying = False
-            self.connected = False
-            self.playing = False
-            self.paused = False
-            self.current = None
-            self.currentTrackObj = None
-            self.position = 0
+            self._resetPlaybackState()
             self.deaf = opts.get('deaf', True)
             self.mute = opts.get('mute', False)
-            self._voiceState = {'voice': {}}
-            self._lastVoiceUpdate = {}
+            self._resetVoiceState()
+            self._lastVoiceUpdateKey = None
 
         self._lastVoiceChannelId = str(vc) if vc else None
 
@@ -159,7 +243,7 @@ class Player:
         if voice_client:
             logger.info(f"Voice client connected for guild {self.guildId}")
 
-        self.salad.emit('playerConnect', self)
+        self._emit('playerConnect', self)
 
     async def handleVoiceStateUpdate(self, data: Dict) -> None:
         """
@@ -177,7 +261,8 @@ class Player:
             return
 
         if sid:
-            self._voiceState['voice']['session_id'] = sid
+            self._voiceSessionId = sid
+            self._refreshVoiceReady()
 
         old_channel = self.voiceChannel
         new_channel = cid
@@ -196,7 +281,7 @@ class Player:
             self.voiceChannel = new_channel
             self._lastVoiceChannelId = new_channel
 
-            self.salad.emit('playerMove', self, old_channel, new_channel)
+            self._emit('playerMove', self, old_channel, new_channel)
 
             self._scheduleVoiceUpdate()
             return
@@ -204,10 +289,10 @@ class Player:
         self.voiceChannel = new_channel
         if new_channel:
             self._lastVoiceChannelId = new_channel
-            self.connected = bool(new_channel)
+            self._markConnected()
 
         self._scheduleVoiceUpdate()
-        self.salad.emit('playerVoiceStateUpdate', self, data)
+        self._emit('playerVoiceStateUpdate', self, data)
 
     async def _handleKickCheck(self) -> None:
         """Check if disconnect was a kick after a delay."""
@@ -217,7 +302,7 @@ class Player:
             if not self.voiceChannel and not self.destroyed and not self._destroying:
                 logger.info(f'Confirmed kick for guild {self.guildId}, destroying player')
 
-                self.salad.emit('playerKick', self)
+                self._emit('playerKick', self)
 
                 await self.destroy(cleanup_voice=False)
 
@@ -234,30 +319,45 @@ class Player:
         if self.destroyed or self._destroying:
             return
 
-        self._voiceState['voice']['token'] = data['token']
-        self._voiceState['voice']['endpoint'] = data['endpoint']
+        self._voiceToken = data['token']
+        self._voiceEndpoint = data['endpoint']
+        self._refreshVoiceReady()
 
         if self._kickCheckTask and not self._kickCheckTask.done():
             self._kickCheckTask.cancel()
 
         self._scheduleVoiceUpdate()
-        self.salad.emit('playerVoiceServerUpdate', self, data)
+        self._emit('playerVoiceServerUpdate', self, data)
 
     def _scheduleVoiceUpdate(self) -> None:
         """Debounce voice updates."""
         if self.destroyed or self._destroying:
             return
 
-        if self._voiceUpdateTask and not self._voiceUpdateTask.done():
-            self._voiceUpdateTask.cancel()
+        if self._lastVoiceUpdateKey == (self._voiceSessionId, self._voiceToken, self._voiceEndpoint):
+            return
+
+        self._voiceDirty += 1
 
-        self._voiceUpdateTask = asyncio.create_task(self._debouncedDispatch())
+        if not self._voiceUpdateTask or self._voiceUpdateTask.done():
+            self._voiceWake = asyncio.Event()
+            self._voiceUpdateTask = asyncio.create_task(self._voiceDispatcher(self._voiceWake))
 
-    async def _debouncedDispatch(self) -> None:
-        """Wait and dispatch."""
+        self._voiceWake.set()
+
+    async def _voiceDispatcher(self, wake: asyncio.Event) -> None:
+        """Long-lived debouncer that sends the latest voice state once it settles."""
         try:
-            await asyncio.sleep(0.05)
-            await self._dispatchVoiceUpdate()
+            while not self.destroyed and not self._destroying:
+                await wake.wait()
+                wake.clear()
+
+                generation = self._voiceDirty
+                await asyncio.sleep(0.05)
+                if generation != self._voiceDirty:
+                    continue
+
+                await self._dispatchVoiceUpdate()
         except asyncio.CancelledError:
             pass
 
@@ -266,20 +366,18 @@ class Player:
         if self.destroyed or self._destroying:
             return
 
-        data = self._voiceState['voice']
-        sid = data.get('session_id')
-        token = data.get('token')
-        endpoint = data.get('endpoint')
+        sid = self._voiceSessionId
+        token = self._voiceToken
+        endpoint = self._voiceEndpoint
 
         if not (sid and token and endpoint):
             return
 
-        if (self._lastVoiceUpdate.get('session_id') == sid and
-            self._lastVoiceUpdate.get('token') == token and
-            self._lastVoiceUpdate.get('endpoint') == endpoint):
+        key = (sid, token, endpoint)
+        if self._lastVoiceUpdateKey == key:
             return
 
-        if not getattr(self.nodes, 'sessionId', None):
+        if not self.nodes.sessionId:
             return
 
         req = {
@@ -292,39 +390,110 @@ class Player:
         }
 
         try:
-            await self.nodes._updatePlayer(self.guildId, data=req)
-            self.connected = True
-            self._lastVoiceUpdate = {
-                'session_id': sid,
-                'token': token,
-                'endpoint': endpoint
-            }
-            self.salad.emit('playerVoiceUpdate', self)
+            await self._nodeUpdate(self.guildId, data=req)
+            self._markConnected()
+            self._lastVoiceUpdateKey = key
+            self._emit('playerVoiceUpdate', self)
             logger.info(f"Voice update dispatched to Lavalink for guild {self.guildId}")
         except Exception as e:
             self.connected = False
             logger.debug(f"Voice update failed: {e}")
 
+    def _queueUpdate(self, **fields: Any) -> asyncio.Future:
+        """Merge fields into the pending PATCH; the future resolves once it is sent."""
+        pending = self._pendingUpdate
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            self._pendingUpdate = pending = {}
+            self._pendingUpdateWaiter = waiter = loop.create_future()
+            self._updateFlushTask = loop.create_task(self._flushUpdate(waiter, self._updateFlushTask))
+        pending.update(fields)
+        return self._pendingUpdateWaiter
+
+    async def _flushUpdate(self, waiter: asyncio.Future, previous: Optional[asyncio.Task] = None) -> None:
+        """Send the merged control update after a short batching window, behind any earlier flush."""
+        try:
+            await asyncio.sleep(0.01)
+            if previous is not None and not previous.done():
+                await asyncio.wait((previous,))
+            if self._pendingUpdateWaiter is not waiter:
+                # discarded by destroy()
+                return
+            data = self._pendingUpdate
+            self._pendingUpdate = None
+            self._pendingUpdateWaiter = None
+            await self._nodeUpdate(self.guildId, data=data)
+        except asyncio.CancelledError:
+            if self._pendingUpdateWaiter is waiter:
+                self._pendingUpdate = None
+                self._pendingUpdateWaiter = None
+            waiter.cancel()
+            raise
+        except Exception as e:
+            waiter.set_exception(e)
+        else:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _discardPendingUpdate(self) -> None:
+        """Drop the unsent batched update and wait out any PATCH already on the wire."""
+        waiter = self._pendingUpdateWaiter
+        self._pendingUpdate = None
+        self._pendingUpdateWaiter = None
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(Exception('Player destroyed'))
+            # callers awaiting it still see the error; unawaited ones are not logged
+            waiter.exception()
+
+        task = self._updateFlushTask
+        self._updateFlushTask = None
+        if task is not None and not task.done():
+            await asyncio.wait((task,))
+
+    async def _safeUpdate(self, data: Optional[Dict] = None, *, replace: bool = False, **fields: Any) -> bool:
+        """
+        Send a player update, returning False instead of raising.
+        Keyword fields go through the control batcher, data is sent as is.
+        """
+        try:
+            if data is None:
+                await self._queueUpdate(**fields)
+            else:
+                await self._nodeUpdate(self.guildId, data=data, replace=replace)
+            return True
+        except Exception as e:
+            logger.debug(f"Player update failed for guild {self.guildId}: {e}")
+            return False
+
     async def play(self) -> None:
-        """Play next track."""
-        async with self._playLock:
+        """Play next track. Calls made while a play is in flight are dropped."""
+        if self._playInFlight:
+            return
+        self._playInFlight = True
+        retry = False
+
+        try:
             self._trackEndHandled = False
 
             if self.destroyed or self._destroying:
                 return
 
-            # wait some secs for voice state to be ready
-            await asyncio.sleep(0.5)
+            # wait some secs for voice state to be ready, unless it already is
+            if not self.connected or not self.isVoiceReady():
+                await asyncio.sleep(0.5)
+
+                if self.destroyed or self._destroying:
+                    return
 
             if not self.isVoiceReady() or not self.connected:
                 logger.warning(f"Cannot play - voice not ready for guild {self.guildId}")
                 return
 
-            if len(self.queue) == 0:
+            if not self.queue:
                 self.playing = False
                 self.current = None
                 self.currentTrackObj = None
-                self.salad.emit('queueEnd', self)
+                self._emit('queueEnd', self)
                 return
 
             item = self.queue.getNext()
@@ -335,34 +504,27 @@ class Player:
             try:
                 self.currentTrackObj = item
 
-                if hasattr(item, 'track') and item.track:
-                    self.current = item.track
-                elif hasattr(item, 'resolve'):
-                    self.current = item.resolve(self.salad)
-                else:
-                    self.playing = False
+                try:
+                    self.current = item.track or item.resolve(self.salad)
+                except AttributeError:
                     self.current = None
                     self.currentTrackObj = None
-                    return
 
                 if not self.current:
                     self.playing = False
                     return
 
-                playData = {
-                    'encodedTrack': self.current,
-                    'position': 0,
-                    'volume': self.volume,
-                    'paused': False
-                }
+                playData = self._PLAY_TEMPLATE.copy()
+                playData['encodedTrack'] = self.current
+                playData['volume'] = self.volume
 
-                await self.nodes._updatePlayer(self.guildId, data=playData)
+                await self._nodeUpdate(self.guildId, data=playData)
 
                 self.position = 0
                 self.playing = True
                 self.paused = False
 
-                self.salad.emit('trackStart', self, item)
+                self._emit('trackStart', self, item)
                 logger.info(f"Started playing track in guild {self.guildId}")
 
             except Exception as e:
@@ -371,9 +533,12 @@ class Player:
                 self.currentTrackObj = None
                 self.queue.consumeNext()
                 logger.debug(f"Play failed: {e}")
+                retry = True
+        finally:
+            self._playInFlight = False
 
-                if len(self.queue) > 0:
-                    asyncio.create_task(self.play())
+        if retry and self.queue:
+            self.nodes._spawn(self.play())
 
     async def skip(self) -> None:
         """Skip current track."""
@@ -381,11 +546,22 @@ class Player:
             return
 
         prev_track = self.currentTrackObj
+        waiter = None
+        if self.current:
+            waiter = self._trackEndWaiter = asyncio.get_running_loop().create_future()
+            # lets a 'stopped' event arriving after the wait below be matched and ignored
+            self._skippedTrack = (self.current, prev_track)
 
-        try:
-            await self.nodes._updatePlayer(self.guildId, data={'encodedTrack': None}, replace=True)
-        except Exception as e:
-            logger.debug(f"Skip stop failed: {e}")
+        await self._safeUpdate(_STOP_PAYLOAD, replace=True)
+
+        # wait for Lavalink's 'stopped' track end instead of a fixed delay
+        if waiter:
+            try:
+                await asyncio.wait_for(waiter, timeout=0.5)
+            except asyncio.TimeoutError:
+                pass
+            if self._trackEndWaiter is waiter:
+                self._trackEndWaiter = None
 
         if self.queue.loop != 'track':
             self.queue.consumeNext()
@@ -395,14 +571,12 @@ class Player:
         self.position = 0
         self.playing = False
 
-        self.salad.emit('trackSkip', self, prev_track)
-
-        await asyncio.sleep(0.2)
+        self._emit('trackSkip', self, prev_track)
 
-        if len(self.queue) > 0:
+        if self.queue:
             await self.play()
         else:
-            self.salad.emit('queueEnd', self)
+            self._emit('queueEnd', self)
 
     async def stop(self) -> None:
         """Stop playback and clear queue."""
@@ -411,11 +585,8 @@ class Player:
 
         was_playing = self.playing
 
-        try:
-            if was_playing or self.current:
-                await self.nodes._updatePlayer(self.guildId, data={'encodedTrack': None}, replace=True)
-        except Exception as e:
-            logger.debug(f"Stop track failed: {e}")
+        if was_playing or self.current:
+            await self._safeUpdate(_STOP_PAYLOAD, replace=True)
 
         self.current = None
         self.currentTrackObj = None
@@ -424,7 +595,7 @@ class Player:
         self.paused = False
         self.queue.clear()
 
-        self.salad.emit('playerStop', self)
+        self._emit('playerStop', self)
 
     async def pause(self, paused: bool = True) -> None:
         """
@@ -439,12 +610,9 @@ class Player:
         if paused:
             if not self.playing:
                 return
-            try:
-                await self.nodes._updatePlayer(self.guildId, data={'paused': True}, replace=True)
+            if await self._safeUpdate(paused=True):
                 self.paused = True
-                self.salad.emit('playerPause', self)
-            except Exception:
-                pass
+                self._emit('playerPause', self)
         else:
             await self.resume()
 
@@ -453,39 +621,30 @@ class Player:
         if self.destroyed or self._destroying or not self.paused:
             return
 
-        try:
-            await self.nodes._updatePlayer(self.guildId, data={'paused': False}, replace=True)
+        if await self._safeUpdate(paused=False):
             self.paused = False
-            self.salad.emit('playerResume', self)
-        except Exception:
-            pass
+            self._emit('playerResume', self)
 
     async def setVolume(self, vol: int) -> None:
         """Set volume."""
         if self.destroyed or self._destroying:
             return
 
-        vol = max(0, min(1000, vol))
+        vol = 0 if vol < 0 else 1000 if vol > 1000 else vol
         old_volume = self.volume
         self.volume = vol
 
-        try:
-            await self.nodes._updatePlayer(self.guildId, data={'volume': vol})
-            self.salad.emit('playerVolumeChange', self, old_volume, vol)
-        except Exception:
-            pass
+        if await self._safeUpdate(volume=vol):
+            self._emit('playerVolumeChange', self, old_volume, vol)
 
     async def seek(self, position: int) -> None:
         """Seek to position."""
         if self.destroyed or self._destroying or not self.playing:
             return
 
-        try:
-            await self.nodes._updatePlayer(self.guildId, data={'position': position})
+        if await self._safeUpdate(position=position):
             self.position = position
-            self.salad.emit('playerSeek', self, position)
-        except Exception:
-            pass
+            self._emit('playerSeek', self, position)
 
     def addToQueue(self, track: 'AudioTrack') -> bool:
         """
@@ -499,6 +658,15 @@ class Player:
         """
         return self.queue.add(track)
 
+    @staticmethod
+    async def _deleteRemote(session, uri: str, headers) -> None:
+        """Send the Lavalink player DELETE, ignoring the response."""
+        try:
+            async with session.delete(uri, headers=headers):
+                pass
+        except Exception:
+            pass
+
     async def destroy(self, *, cleanup_voice: bool = True) -> None:
         """
         Destroy player and cleanup all resources.
@@ -513,6 +681,8 @@ class Player:
 
         self._destroying = True
 
+        await self._discardPendingUpdate()
+
         if self._kickCheckTask and not self._kickCheckTask.done():
             self._kickCheckTask.cancel()
             try:
@@ -524,7 +694,7 @@ class Player:
             try:
                 await self._voiceCleanupCallback(self.guildId)
             except Exception as e:
-                self.salad.emit('playerVoiceError', self, e)
+                self._emit('playerVoiceError', self, e)
 
         if self._voiceUpdateTask and not self._voiceUpdateTask.done():
             try:
@@ -536,41 +706,11 @@ class Player:
         self.playing = False
         self.paused = False
 
-        local_session = None
-        local_session_created = False
-
-        try:
-            if (hasattr(self.nodes, 'sessionId') and
-                getattr(self.nodes, 'sessionId') and
-                hasattr(self.nodes, 'host') and
-                hasattr(self.nodes, 'port') and
-                self.guildId):
-
-                scheme = 'https' if getattr(self.nodes, 'ssl', False) else 'http'
-                uri = (f"{scheme}://{self.nodes.host}:{self.nodes.port}/"
-                       f"v4/sessions/{self.nodes.sessionId}/players/{self.guildId}")
-
-                session = getattr(self.nodes, 'session', None)
-                if not session:
-                    local_session = aiohttp.ClientSession()
-                    session = local_session
-                    local_session_created = True
-
-                headers = getattr(self.nodes, 'headers', {}) or {}
-
-                try:
-                    async with session.delete(uri, headers=headers) as resp:
-                        pass
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        finally:
-            if local_session_created and local_session:
-                try:
-                    await local_session.close()
-                except Exception:
-                    pass
+        node = self.nodes
+        session = node.session
+        if node._playersUri and self.guildId and session and not session.closed:
+            # awaited so a player re-created for this guild right after cannot be hit by a late DELETE
+            await self._deleteRemote(session, f"{node._playersUri}{self.guildId}", node.headers)
 
         try:
             await self.stop()
@@ -582,51 +722,26 @@ class Player:
         except Exception:
             pass
 
-        try:
-            self.queue = NullQueue(self)
-        except Exception:
-            self.queue = NullQueue()
+        self.queue = _NULL_QUEUE
 
-        self.current = None
-        self.currentTrackObj = None
-        self.position = 0
-        self.playing = False
-        self.paused = False
-        self.connected = False
+        self._resetPlaybackState()
         self.volume = 100
         self._voice_client = None
-
-        if cleanup_voice and self._voiceCleanupCallback and self.guildId:
-            try:
-                await self._voiceCleanupCallback(self.guildId)
-            except Exception:
-                pass
-
-        if self._voiceUpdateTask and not self._voiceUpdateTask.done():
-            self._voiceUpdateTask.cancel()
         self.voiceChannel = None
         self.textChannel = None
 
         self._voiceCleanupCallback = None
         self.destroyed = True
 
-        try:
-            if hasattr(self.nodes, 'players') and isinstance(self.nodes.players, dict):
-                self.nodes.players.pop(self.guildId, None)
-        except Exception:
-            pass
-
-        if hasattr(self.salad, 'destroyPlayer'):
-            self.salad.destroyPlayer(self.guildId)
+        self.nodes.players.pop(self.guildId, None)
+        self.salad.destroyPlayer(self.guildId)
 
-        self.salad.emit('playerDestroy', self, None)
+        self._emit('playerDestroy', self, None)
         logger.info(f"Player destroyed for guild {self.guildId}")
 
     def get_lyrics_handler(self):
         """Returns the lyrics handler from the node if available."""
-        if self.nodes and hasattr(self.nodes, 'lyrics'):
-            return self.nodes.lyrics
-        return None
+        return self.nodes.lyrics if self.nodes else None
 
     def toggle_autoplay(self) -> bool:
         """Toggles the autoplay state."""
@@ -15,6 +15,8 @@
 URL: https://www.wtfpl.net/txt/copying/
 """
 import asyncio
+import os
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Optional, Any, List, Callable
 import logging
@@ -107,7 +109,7 @@ class PlayerStateManager:
 
             queue_tracks = []
             if hasattr(player.queue, '_q') and player.queue._q:
-                for track in player.queue._q[:100]:  
+                for track in islice(player.queue._q, 100):
                     track_data = {
                         'encoded': getattr(track, 'track', None),
                         'info': getattr(track, 'info', {}),
@@ -149,21 +151,14 @@ class PlayerStateManager:
 
             try:
                 if HAS_MSGPACK:
-                    msgpack_data = cast(bytes, msgpack.packb(states, use_bin_type=True))
-                    if HAS_AIOFILES:
-                        async with aiofiles.open(self.state_file, 'wb') as f:
-                            await f.write(msgpack_data)
-                    else:
-                        with open(self.state_file, 'wb') as f:
-                            f.write(msgpack_data)
+                    data = cast(bytes, msgpack.packb(states, use_bin_type=True))
                 else:
-                    json_data = cast(str, json.dumps(states))
-                    if HAS_AIOFILES:
-                        async with aiofiles.open(self.state_file, 'w') as f:
-                            await f.write(json_data)
-                    else:
-                        with open(self.state_file, 'w') as f:
-                            f.write(json_data)
+                    data = json.dumps(states)
+                    if isinstance(data, str):
+                        data = data.encode()
+
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._write_atomic, self.state_file, data)
 
                 self._dirty_players.clear()
                 return len(states)
@@ -171,6 +166,20 @@ class PlayerStateManager:
                 logger.error(f"Save failed: {e}")
                 return 0
 
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write data in one syscall, fsync it and swap it over the old file."""
+        tmp = path.with_name(path.name + '.tmp')
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+
     async def load_states(self) -> List[Dict]:
         if not self.state_file.exists():
             return []
@@ -349,14 +358,14 @@ class PlayerStateManager:
 
                 except Exception as e:
                     logger.error(f"Failed to restore current track: {e}")
-                    if len(player.queue) > 0:
+                    if player.queue:
                         logger.info("Attempting to play from queue after current track failure")
                         try:
                             await player.play()
                         except Exception as play_error:
                             logger.error(f"Failed to play from queue: {play_error}")
 
-            elif len(player.queue) > 0:
+            elif player.queue:
                 logger.info("No current track, starting playback from queue")
                 try:
                     await player.play()
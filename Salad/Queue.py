@@ -14,7 +14,8 @@
 
 URL: https://www.wtfpl.net/txt/copying/
 """
-from typing import Optional, List, TYPE_CHECKING
+from collections import deque
+from typing import Optional, Deque, TYPE_CHECKING
 import random
 
 if TYPE_CHECKING:
@@ -29,10 +30,10 @@ class Queue:
 
     def __init__(self, player: 'Player'):
         self.player = player
-        self._q: List['AudioTrack'] = []
+        self._q: Deque['AudioTrack'] = deque()
         self.loop: Optional[str] = None
-        self.previous: List['AudioTrack'] = []
         self._maxPreviousSize = 10
+        self.previous: Deque['AudioTrack'] = deque(maxlen=self._maxPreviousSize)
 
     def add(self, track: 'AudioTrack') -> bool:
         """Add track to queue."""
@@ -41,6 +42,13 @@ class Queue:
         self._q.append(track)
         return True
 
+    def extend(self, tracks) -> int:
+        """Add several tracks at once; returns the number added."""
+        q = self._q
+        before = len(q)
+        q.extend(t for t in tracks if t)
+        return len(q) - before
+
     def insert(self, track: 'AudioTrack', position: int = 0) -> bool:
         """Insert track at position."""
         if not track:
@@ -51,8 +59,13 @@ class Queue:
 
     def remove(self, index: int) -> Optional['AudioTrack']:
         """Remove track at index."""
-        if 0 <= index < len(self._q):
-            return self._q.pop(index)
+        q = self._q
+        if 0 <= index < len(q):
+            if index == 0:
+                return q.popleft()
+            track = q[index]
+            del q[index]
+            return track
         return None
 
     def clear(self) -> None:
@@ -61,8 +74,10 @@ class Queue:
         self.previous.clear()
 
     def shuffle(self) -> None:
-        """Shuffle queue in-place."""
-        random.shuffle(self._q)
+        """Shuffle queue; shuffles a list copy since deque indexing is O(n)."""
+        tracks = list(self._q)
+        random.shuffle(tracks)
+        self._q = deque(tracks)
 
     def getNext(self) -> Optional['AudioTrack']:
         """Get next track without removing."""
@@ -71,7 +86,7 @@ class Queue:
 
         if not self._q:
             if self.loop == 'queue' and self.previous:
-                self._q = self.previous.copy()
+                self._q = deque(self.previous)
                 self.previous.clear()
                 return self._q[0] if self._q else None
             return None
@@ -83,12 +98,8 @@ class Queue:
         if not self._q:
             return None
 
-        consumed = self._q.pop(0)
+        consumed = self._q.popleft()
         self.previous.append(consumed)
-
-        if len(self.previous) > self._maxPreviousSize:
-            self.previous.pop(0)
-
         return consumed
 
     def peek(self, index: int = 0) -> Optional['AudioTrack']:
@@ -99,7 +110,7 @@ class Queue:
 
     def getAll(self) -> 'TrackList':
         """Get copy of all tracks."""
-        return self._q.copy()
+        return list(self._q)
 
     def __len__(self) -> int:
         return len(self._q)
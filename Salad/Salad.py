@@ -15,14 +15,18 @@
 URL: https://www.wtfpl.net/txt/copying/
 """
 from .Node import Node
+from .Rest import RequestTimeout
 from .Player import Player
 from .Track import Track
 from .EventEmitter import EventEmitter
 from .voiceclient import SaladVoiceClient
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple
 import asyncio
+import time
 import urllib.parse
-import weakref
 import logging
 
 logger = logging.getLogger(__name__)
@@ -44,13 +48,38 @@ EMPTY_TRACKS_RESPONSE = {
     'tracks': []
 }
 
+EMPTY_LOAD_TYPES = frozenset(('empty', 'NO_MATCHES'))
+UNCACHED_LOAD_TYPES = EMPTY_LOAD_TYPES | {'error', 'LOAD_FAILED'}
+SEARCH_SOURCES = frozenset(('ytsearch', 'ytmsearch', 'scsearch'))
+# read-only fallback for nested lookups; never handed back to callers
+_EMPTY_MAPPING = MappingProxyType({})
+
+_PlayerStateManagerCls: Optional[type] = None
+
+
+def _getPlayerStateManager() -> type:
+    """Import PlayerStateManager on first use and keep the class."""
+    global _PlayerStateManagerCls
+    if _PlayerStateManagerCls is None:
+        from .PlayerStateManager import PlayerStateManager
+        _PlayerStateManagerCls = PlayerStateManager
+    return _PlayerStateManagerCls
+
+
+@lru_cache(maxsize=1024)
+def _loadTracksEndpoint(identifier: str) -> str:
+    """Percent-encode a loadtracks identifier into its endpoint path."""
+    return f"/v4/loadtracks?identifier={urllib.parse.quote(identifier)}"
+
 
 class Salad(EventEmitter):
     """The main file for the Salad client"""
-    __slots__ = ('nodes', 'client', 'players', '_player_refs', 'initiated',
+    __slots__ = ('nodes', 'client', 'players', 'initiated',
                  'clientId', 'started', 'opts', 'version', '_listeners',
                  '_once_listeners', '_max_listeners', '_cleanup_counter',
-                 '_state_manager', '_restoring_players')
+                 '_state_manager', '_restoring_players', '_resolve_cache',
+                 '_resolve_cache_max', '_resolve_cache_ttl', '_resolve_inflight',
+                 '_rr_index')
 
     def __init__(self, client, nodes, opts=None):
         super().__init__(max_listeners=1000)
@@ -61,7 +90,6 @@ class Salad(EventEmitter):
         self.nodes: List[Node] = []
         self.client = client
         self.players: Dict[int, Player] = {}
-        self._player_refs: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
         self.initiated = False
         self.clientId: Optional[str] = None
@@ -70,28 +98,33 @@ class Salad(EventEmitter):
         self.version = "1.0.0"
         self._state_manager = None
         self._restoring_players = False
+        self._resolve_cache: 'OrderedDict[Tuple[str, str], Tuple[float, Dict]]' = OrderedDict()
+        self._resolve_cache_max = self.opts.get('resolveCacheSize', 2048)
+        self._resolve_cache_ttl = self.opts.get('resolveCacheTTL', 86400.0)
+        self._resolve_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._rr_index = 0
 
         if opts and opts.get('enableReconnect', True):
-            from .PlayerStateManager import PlayerStateManager
             state_file = opts.get('stateFile', 'player_states.jsonl')
             save_interval = opts.get('stateSaveInterval', 5.0)
-            self._state_manager = PlayerStateManager(self, state_file, save_interval)
+            self._state_manager = _getPlayerStateManager()(self, state_file, save_interval)
 
     async def start(self, nodes: List[Dict], userId: str) -> 'Salad':
         if self.started:
             return self
 
         self.clientId = userId
+        if self.opts.get('eagerTasks', False):
+            self.configure_loop()
         self.nodes = [Node(self, nc, self.opts) for nc in nodes]
 
         for node in self.nodes:
             node.updateClientId(userId)
 
         conn_tasks = [asyncio.create_task(n.connect()) for n in self.nodes]
+        # Node.connect() only returns once the ready op delivered a session (or failed)
         await asyncio.gather(*conn_tasks, return_exceptions=True)
 
-        await asyncio.sleep(2.0)
-
         if self.state_manager:
             await self.state_manager.start()
             self.state_manager.set_voice_connect_callback(self._voice_connect_for_restore)
@@ -103,6 +136,28 @@ class Salad(EventEmitter):
 
         return self
 
+    @staticmethod
+    def configure_loop(loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+        """
+        Install asyncio.eager_task_factory on the loop (Python 3.12+).
+
+        Args:
+            loop: Loop to configure, defaults to the running loop
+
+        Returns:
+            bool: True if the eager factory is active on the loop
+        """
+        eager_factory = getattr(asyncio, 'eager_task_factory', None)
+        if not eager_factory:
+            return False
+
+        loop = loop or asyncio.get_running_loop()
+        factory = loop.get_task_factory()
+        if factory is None:
+            loop.set_task_factory(eager_factory)
+            return True
+        return factory is eager_factory
+
     async def _voice_connect_for_restore(self, guild_id: int, voice_channel_id: str,
                                          deaf: bool = True, mute: bool = False) -> bool:
         """
@@ -158,15 +213,14 @@ class Salad(EventEmitter):
         if not gid:
             return None
 
-        if gid in self.players:
-            existing = self.players[gid]
+        existing = self.players.get(gid)
+        if existing is not None:
             if not existing.destroyed:
                 return existing
             del self.players[gid]
 
         player = Player(self, node, opts)
         self.players[gid] = player
-        self._player_refs[gid] = player
         node.players[gid] = player
 
         player.setVoiceCleanupCallback(self._cleanup_voice_connection)
@@ -219,10 +273,7 @@ class Salad(EventEmitter):
         existing = self.players.get(gid)
         if existing:
             if existing.destroyed:
-                try:
-                    del self.players[gid]
-                except KeyError:
-                    pass
+                self.players.pop(gid, None)
                 existing = None
             else:
                 return existing
@@ -287,16 +338,12 @@ class Salad(EventEmitter):
         return None
 
     def destroyPlayer(self, guildId: int) -> None:
-        try:
-            del self.players[guildId]
-        except KeyError:
-            pass
+        self.players.pop(guildId, None)
 
     async def stop(self) -> None:
-        player_tasks = []
-        for player in list(self.players.values()):
-            if not player.destroyed:
-                player_tasks.append(asyncio.create_task(player.destroy()))
+        # snapshot: with eager tasks destroy() can drop itself from players immediately
+        player_tasks = [asyncio.create_task(p.destroy())
+                        for p in tuple(self.players.values()) if not p.destroyed]
 
         if player_tasks:
             await asyncio.gather(*player_tasks, return_exceptions=True)
@@ -304,31 +351,35 @@ class Salad(EventEmitter):
         if self.state_manager:
             await self.state_manager.stop()
 
-        for node in self.nodes:
-            await node._cleanup()
-            if hasattr(node, 'rest') and hasattr(node.rest, 'close'):
-                await node.rest.close()
+        await asyncio.gather(*(self._shutdownNode(n) for n in self.nodes), return_exceptions=True)
 
         self.players.clear()
-        self._player_refs.clear()
         self.started = False
 
         self.emit('shutdown', self)
 
-    def _getReqNode(self, nodes: Optional[List[Node]] = None) -> Optional[Node]:
-        node_list = nodes or self.nodes
+    @staticmethod
+    async def _shutdownNode(node: Node) -> None:
+        """Stop a node's reconnect loop, then close its socket and REST session."""
+        await node._stopReconnect()
+        try:
+            await node._cleanup()
+        finally:
+            await node.rest.close()
 
-        for node in node_list:
-            if node.connected and node.sessionId:
-                return node
+    def _getReqNode(self, nodes: Optional[List[Node]] = None) -> Optional[Node]:
+        """Pick a ready node, rotating across the ready set on each call."""
+        ready = [n for n in (nodes or self.nodes) if n.connected and n.sessionId]
+        if not ready:
+            return None
 
-        return None
+        idx = self._rr_index % len(ready)
+        self._rr_index = idx + 1
+        return ready[idx]
 
     @staticmethod
     def _formatQuery(query: str, source: str = 'ytsearch') -> str:
-        if source in ('ytsearch', 'ytmsearch', 'scsearch'):
-            return f"{source}:{query}"
-        return query
+        return f"{source}:{query}" if source in SEARCH_SOURCES else query
 
     @staticmethod
     def _makeTrack(data: Any, requester: Any, node: Node) -> Optional[Track]:
@@ -336,6 +387,12 @@ class Salad(EventEmitter):
             return Track(data, requester)
         return None
 
+    @staticmethod
+    def _buildTracks(items: List[Any], requester: Any) -> List[Track]:
+        """Build Tracks from raw track dicts, keeping only playable ones."""
+        return [t for td in items if type(td) is dict
+                for t in (Track(td, requester),) if t.track]
+
     async def resolve(self, query: str, source: str = 'ytsearch',
                      requester: Any = None, nodes: Optional[List[Node]] = None) -> Dict:
         if not self.started:
@@ -345,37 +402,114 @@ class Salad(EventEmitter):
         if not node:
             raise Exception('No nodes available')
 
-        formatted = self._formatQuery(query, source)
-        endpoint = f"/v4/loadtracks?identifier={urllib.parse.quote(formatted)}"
+        key = (source, query)
+        cached = self._getCachedResolve(key)
+        if cached is not None:
+            return self._constructResp(cached, requester, node)
+
+        endpoint = _loadTracksEndpoint(self._formatQuery(query, source))
 
         try:
-            resp = await node.rest.makeRequest('GET', endpoint)
+            resp = await self._loadTracks(key, node, endpoint)
 
             if isinstance(resp, dict):
-                if not resp or resp.get('loadType') in ('empty', 'NO_MATCHES'):
-                    return EMPTY_TRACKS_RESPONSE
+                if not resp or resp.get('loadType') in EMPTY_LOAD_TYPES:
+                    # fresh containers so callers cannot mutate the shared template
+                    return {**EMPTY_TRACKS_RESPONSE, 'pluginInfo': {}, 'tracks': []}
+                self._cacheResolve(key, resp)
                 return self._constructResp(resp, requester, node)
             else:
                 raise Exception('Invalid response type from node')
 
+        except RequestTimeout:
+            raise Exception('Request timeout')
         except Exception as e:
-            error_name = getattr(e, 'name', None)
-            if error_name == 'AbortError':
-                raise Exception('Request timeout')
             raise Exception(f"Resolve failed: {str(e)}")
 
+    async def resolve_many(self, queries: List[str], source: str = 'ytsearch',
+                           requester: Any = None, nodes: Optional[List[Node]] = None) -> List[Any]:
+        """
+        Resolve several queries concurrently.
+
+        Args:
+            queries: Queries to resolve
+            source: Search source applied to every query
+            requester: Requester attached to the returned tracks
+            nodes: Optional node subset to resolve against
+
+        Returns:
+            list: One response dict per query, in order, or the exception it raised
+        """
+        return await asyncio.gather(
+            *(self.resolve(q, source, requester, nodes) for q in queries),
+            return_exceptions=True
+        )
+
+    async def _loadTracks(self, key: Tuple[str, str], node: Node, endpoint: str) -> Any:
+        """Run one loadtracks request per key; concurrent callers share its result."""
+        inflight = self._resolve_inflight
+        fut = inflight.get(key)
+        if fut is not None:
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        inflight[key] = fut
+        try:
+            async with node._resolveSem:
+                resp = await node.rest.makeRequest('GET', endpoint)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                fut.set_exception(Exception('Resolve cancelled'))
+            else:
+                fut.set_exception(e)
+            # mark retrieved so an unshared failure is not logged twice
+            fut.exception()
+            raise
+        else:
+            fut.set_result(resp)
+            return resp
+        finally:
+            if inflight.get(key) is fut:
+                del inflight[key]
+
+    def _getCachedResolve(self, key: Tuple[str, str]) -> Optional[Dict]:
+        """Return a cached raw loadtracks response if it has not expired."""
+        entry = self._resolve_cache.get(key)
+        if entry is None:
+            return None
+        stored, resp = entry
+        if time.monotonic() - stored >= self._resolve_cache_ttl:
+            del self._resolve_cache[key]
+            return None
+        self._resolve_cache.move_to_end(key)
+        return resp
+
+    def _cacheResolve(self, key: Tuple[str, str], resp: Dict) -> None:
+        """Store a raw loadtracks response, evicting the least recently used."""
+        if self._resolve_cache_max <= 0 or resp.get('loadType') in UNCACHED_LOAD_TYPES:
+            return
+        cache = self._resolve_cache
+        cache[key] = (time.monotonic(), resp)
+        cache.move_to_end(key)
+        while len(cache) > self._resolve_cache_max:
+            cache.popitem(last=False)
+
     def _constructResp(self, resp: Dict, requester: Any, node: Node) -> Dict:
         """Constructs a standardized response dictionary from the node's response.
+        Nested dicts are copied since resp may be a shared resolve cache entry.
         """
         loadType = resp.get('loadType', 'empty')
+        if loadType in EMPTY_LOAD_TYPES:
+            return {**EMPTY_TRACKS_RESPONSE, 'loadType': loadType, 'pluginInfo': {}, 'tracks': []}
+
         data = resp.get('data')
-        rootPlugin = resp.get('pluginInfo', {})
+        rootPlugin = resp.get('pluginInfo')
 
         base = {
             'loadType': loadType,
             'exception': None,
             'playlistInfo': None,
-            'pluginInfo': rootPlugin or {},
+            'pluginInfo': dict(rootPlugin) if rootPlugin else {},
             'tracks': []
         }
 
@@ -384,18 +518,23 @@ class Salad(EventEmitter):
             return base
 
         if loadType == 'track' and data:
-            base['pluginInfo'] = data.get('info', {}).get('pluginInfo',
-                                                          data.get('pluginInfo', base['pluginInfo']))
+            info = data.get('info')
+            if info and 'pluginInfo' in info:
+                base['pluginInfo'] = dict(info['pluginInfo'] or _EMPTY_MAPPING)
+            elif 'pluginInfo' in data:
+                base['pluginInfo'] = dict(data['pluginInfo'] or _EMPTY_MAPPING)
             track = self._makeTrack(data, requester, node)
             if track and track.track:
                 base['tracks'].append(track)
 
         elif loadType == 'playlist' and data:
-            info = data.get('info')
+            data_get = data.get
+            info = data_get('info')
+            tracks_data = data_get('tracks') or []
             if info:
-                thumb = (data.get('pluginInfo', {}).get('artworkUrl') or
-                        (data.get('tracks', [{}])[0].get('info', {}).get('artworkUrl')
-                         if data.get('tracks') else None))
+                thumb = (data_get('pluginInfo') or _EMPTY_MAPPING).get('artworkUrl')
+                if not thumb and tracks_data:
+                    thumb = (tracks_data[0].get('info') or _EMPTY_MAPPING).get('artworkUrl')
 
                 base['playlistInfo'] = {
                     'name': info.get('name') or info.get('title'),
@@ -403,20 +542,15 @@ class Salad(EventEmitter):
                     **info
                 }
 
-            base['pluginInfo'] = data.get('pluginInfo', base['pluginInfo'])
+            playlistPlugin = data_get('pluginInfo')
+            if playlistPlugin is not None:
+                base['pluginInfo'] = dict(playlistPlugin)
 
-            tracks_data = data.get('tracks', [])
             if isinstance(tracks_data, list):
-                for td in tracks_data:
-                    track = self._makeTrack(td, requester, node)
-                    if track and track.track:
-                        base['tracks'].append(track)
+                base['tracks'] = self._buildTracks(tracks_data, requester)
 
         elif loadType == 'search' and isinstance(data, list):
-            for td in data:
-                track = self._makeTrack(td, requester, node)
-                if track and track.track:
-                    base['tracks'].append(track)
+            base['tracks'] = self._buildTracks(data, requester)
 
         return base
 
@@ -447,7 +581,7 @@ class Salad(EventEmitter):
     @property
     def state_manager(self):
         """Get the player state manager."""
-        return getattr(self, '_state_manager', None)
+        return self._state_manager
 
     @state_manager.setter
     def state_manager(self, value):
@@ -17,18 +17,23 @@ URL: https://www.wtfpl.net/txt/copying/
 from typing import Optional, Tuple
 
 class Track:
+  __slots__ = ('track', 'identifier', 'isSeekable', 'author', 'length', 'isStream',
+               'title', 'uri', 'sourceName', 'isrc', 'requester', '_lyrics', '_lyrics_synced')
+
   def __init__(self, data, requester=None):
-    self.track = data.get('track') or data.get('encoded')
-    info = data.get('info', {})
-    self.identifier = info.get('identifier') or data.get('identifier', '')
-    self.isSeekable = info.get('isSeekable', data.get('isSeekable', True))
-    self.author = info.get('author') or data.get('author', '')
-    self.length = info.get('length') or data.get('length', 0)
-    self.isStream = info.get('isStream', data.get('isStream', False))
-    self.title = info.get('title') or data.get('title', '')
-    self.uri = info.get('uri') or data.get('uri', '')
-    self.sourceName = info.get('sourceName') or data.get('sourceName', '')
-    self.isrc = info.get('isrc') or data.get('isrc', '')
+    dg = data.get
+    info = dg('info') or {}
+    ig = info.get
+    self.track = dg('track') or dg('encoded')
+    self.identifier = ig('identifier') or dg('identifier', '')
+    self.isSeekable = ig('isSeekable', dg('isSeekable', True))
+    self.author = ig('author') or dg('author', '')
+    self.length = ig('length') or dg('length', 0)
+    self.isStream = ig('isStream', dg('isStream', False))
+    self.title = ig('title') or dg('title', '')
+    self.uri = ig('uri') or dg('uri', '')
+    self.sourceName = ig('sourceName') or dg('sourceName', '')
+    self.isrc = ig('isrc') or dg('isrc', '')
     self.requester = requester
     self._lyrics = None
     self._lyrics_synced = False
@@ -4,6 +4,15 @@ __contibutors__ = 'southctrl'
 __version__ = '1.2.4'
 __all__ = ['Rest', 'Node', 'Salad', 'Player', 'Queue', 'Track', 'EventEmitter', 'Filters', 'PlayerStateManager', 'SaladVoiceClient', 'Lyrics']
 
+import os
+
+if os.environ.get('SALAD_UVLOOP', '').lower() in ('1', 'true', 'yes'):
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
 from .Rest import Rest
 from .Node import Node
 from .Salad import Salad
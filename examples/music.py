@@ -23,11 +23,63 @@ from discord import app_commands
 
 from salada import Salad
 import asyncio
+import json
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SESSION_FILE = 'lavalink_sessions.json'
+_BLUE = discord.Color.blue()
+_GREEN = discord.Color.green()
+
+
+def load_session_ids() -> dict:
+    """Read the per-node Lavalink session IDs saved by the previous run."""
+    with suppress(OSError, ValueError):
+        with open(SESSION_FILE) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    return {}
+
+
+def save_session_id(node_key: str, session_id: Optional[str]) -> None:
+    """Persist a node's Lavalink session ID so the next run can resume it."""
+    if not session_id:
+        return
+    sessions = load_session_ids()
+    sessions[node_key] = session_id
+    with suppress(OSError):
+        with open(SESSION_FILE, 'w') as f:
+            json.dump(sessions, f)
+
+
+_log_info = logger.info
+
+
+def _on_node_ready(node, data):
+    save_session_id(f'{node.host}:{node.port}', node.sessionId)
+
+
+def _on_node_resumed(node):
+    _log_info(f'Resumed Lavalink session {node.sessionId}')
+
+
+def _on_track_start(player, track):
+    _log_info(f'Track started: {getattr(track, "title", track)}')
+
+
+def _on_track_end(player, track, reason):
+    _log_info(f'Track ended: {reason}')
+
+
+def _on_track_error(player, track, error):
+    logger.error(f'Track error: {error}')
+
+
+def _on_queue_end(player):
+    _log_info(f'Queue ended for guild {player.guildId}')
+
 
 class SaladVoiceClient(discord.VoiceProtocol):
     """Custom voice protocol for Lavalink integration."""
@@ -35,9 +87,10 @@ class SaladVoiceClient(discord.VoiceProtocol):
     def __init__(self, client, channel):
         self.client = client
         self.channel = channel
-        self.guild = getattr(channel, 'guild', None)
-        self.guild_id = self.guild.id if self.guild else None
+        self.guild = channel.guild
+        self.guild_id = self.guild.id
         self._connected = False
+        self._voice_clients = getattr(getattr(client, '_connection', None), '_voice_clients', None)
 
     async def on_voice_state_update(self, data):
         if not self.guild_id:
@@ -77,46 +130,63 @@ class SaladVoiceClient(discord.VoiceProtocol):
 
     def cleanup(self):
         self._connected = False
-        with suppress(Exception):
-            if self.guild_id and hasattr(self.client, '_connection'):
-                voice_clients = self.client._connection._voice_clients
-                if self.guild_id in voice_clients:
-                    del voice_clients[self.guild_id]
+        if self._voice_clients is not None:
+            self._voice_clients.pop(self.guild_id, None)
 
     def is_connected(self):
         return self._connected
 
 
-class Music(commands.Cog):
+def guild_only_check():
+    """Reject app commands used outside a server before the command runs."""
+    async def predicate(interaction: discord.Interaction) -> bool:
+        if interaction.guild:
+            return True
+        await interaction.response.send_message(
+            'This command must be used in a server!',
+            ephemeral=True
+        )
+        return False
+    return app_commands.check(predicate)
+
+
+class Music(commands.GroupCog, group_name='music'):
     """Music cog with full queue system."""
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.salad: Optional[Salad] = None
+        self._bot_user_id: Optional[int] = None
+        self._load_handlers = {
+            'empty': self._handle_empty,
+            'error': self._handle_error,
+            'playlist': self._handle_playlist,
+            'track': self._handle_track,
+            'search': self._handle_track
+        }
         bot.loop.create_task(self.start_salad())
 
+    async def cog_unload(self) -> None:
+        """Persist player state and close Lavalink sessions on shutdown."""
+        if self.salad:
+            await self.salad.stop()
+
     async def cleanup_voice_for_guild(self, guild_id: int) -> None:
         """Cleanup voice connection for a guild."""
         guild = self.bot.get_guild(guild_id)
-        if not guild or not guild.voice_client:
-            return
-
-        with suppress(Exception):
-            await guild.voice_client.disconnect(force=True)
-            guild.voice_client.cleanup()
-
-        await asyncio.sleep(0.3)
+        if guild:
+            await self.ensure_voice_disconnected(guild)
 
     async def ensure_voice_disconnected(self, guild: discord.Guild) -> None:
         """Ensure guild is fully disconnected from voice."""
-        if not guild.voice_client:
+        voice_client = guild.voice_client
+        if not voice_client:
             return
 
+        # SaladVoiceClient.disconnect awaits the gateway update and unregisters itself
         with suppress(Exception):
-            await guild.voice_client.disconnect(force=True)
-            guild.voice_client.cleanup()
-
-        await asyncio.sleep(0.3)
+            await voice_client.disconnect(force=True)
+            voice_client.cleanup()
 
     async def connect_voice(self, guild: discord.Guild, channel: discord.VoiceChannel):
         """Connect to voice channel with proper cleanup."""
@@ -131,10 +201,9 @@ class Music(commands.Cog):
             return cast(SaladVoiceClient, voice_client)
         except discord.errors.ClientException as e:
             if "Already connected" in str(e):
-                with suppress(Exception):
-                    if hasattr(self.bot, '_connection') and hasattr(self.bot._connection, '_voice_clients'):
-                        if guild.id in self.bot._connection._voice_clients:
-                            del self.bot._connection._voice_clients[guild.id]
+                voice_clients = getattr(getattr(self.bot, '_connection', None), '_voice_clients', None)
+                if voice_clients is not None:
+                    voice_clients.pop(guild.id, None)
 
                 await asyncio.sleep(1.0)
 
@@ -147,6 +216,7 @@ class Music(commands.Cog):
     async def start_salad(self):
         """Initialize Salad client and connect to Lavalink nodes."""
         await self.bot.wait_until_ready()
+        self._bot_user_id = self.bot.user.id if self.bot.user else 0
 
         nodes = [{
             'host': '127.0.0.1',
@@ -154,19 +224,23 @@ class Music(commands.Cog):
             'auth': 'youshallnotpass',
             'ssl': False
         }]
+        sessions = load_session_ids()
+        for node in nodes:
+            node['resumeSessionId'] = sessions.get(f"{node['host']}:{node['port']}")
 
         self.salad = Salad(self.bot, nodes, opts={
             'enableReconnect': True,
             'infiniteReconnect': True,
             'maxReconnectAttempts': 10,
             'baseReconnectDelay': 2.0,
-            'maxReconnectDelay': 300.0
+            'maxReconnectDelay': 300.0,
+            'resumeTimeout': 360
         })
-
-        bot_user_id = str(self.bot.user.id if self.bot.user else 0)
+        self.salad.on('nodeReady', _on_node_ready)
+        self.salad.on('nodeResumed', _on_node_resumed)
 
         try:
-            await self.salad.start(nodes, bot_user_id)
+            await self.salad.start(nodes, str(self._bot_user_id))
             logger.info('Salad client started successfully')
         except Exception as e:
             logger.error(f'Failed to start Salad: {e}')
@@ -179,6 +253,11 @@ class Music(commands.Cog):
                 if not guild:
                     return False
 
+                # a resumed Lavalink session only helps if Discord voice survived too
+                voice_client = guild.voice_client
+                if voice_client and voice_client.is_connected() and any(node.resumed for node in self.salad.nodes):
+                    return True
+
                 channel = guild.get_channel(int(channel_id))
                 if not channel or not isinstance(channel, discord.VoiceChannel):
                     return False
@@ -201,10 +280,30 @@ class Music(commands.Cog):
         if self.salad.state_manager:
             self.salad.state_manager.set_voice_connect_callback(reconnect_to_voice)
 
-        self.salad.on('trackStart', lambda p, t: logger.info(f'Track started: {t.title if hasattr(t, "title") else t}'))
-        self.salad.on('trackEnd', lambda p, t, r: logger.info(f'Track ended: {r}'))
-        self.salad.on('trackError', lambda p, t, e: logger.error(f'Track error: {e}'))
-        self.salad.on('queueEnd', lambda p: logger.info(f'Queue ended for guild {p.guildId}'))
+        self.salad.on('trackStart', _on_track_start)
+        self.salad.on('trackEnd', _on_track_end)
+        self.salad.on('trackError', _on_track_error)
+        self.salad.on('queueEnd', _on_queue_end)
+
+    async def _get_active_player(
+        self,
+        interaction: discord.Interaction,
+        require_current: bool = False,
+        missing_msg: str = 'No active player!'
+    ):
+        """Return the guild's live player, or reply with an error and return None."""
+        send = interaction.response.send_message
+        salad = self.salad
+        player = salad.players.get(interaction.guild.id) if salad else None
+        if not player or player.destroyed:
+            await send('Nothing playing!' if require_current else missing_msg, ephemeral=True)
+            return None
+
+        if require_current and not player.current:
+            await send('Nothing playing!', ephemeral=True)
+            return None
+
+        return player
 
     async def get_or_create_player(self, interaction: discord.Interaction):
         """Get existing player or create new one."""
@@ -217,10 +316,6 @@ class Music(commands.Cog):
             return None
 
         guild = interaction.guild
-        if not guild:
-            await interaction.followup.send('This command must be used in a server!', ephemeral=True)
-            return None
-
         user_channel = interaction.user.voice.channel
         player = self.salad.players.get(guild.id)
 
@@ -229,10 +324,12 @@ class Music(commands.Cog):
             bot_in_voice = guild.me.voice is not None and guild.me.voice.channel is not None
 
             if not bot_in_voice or not voice_client or not voice_client.is_connected():
-                with suppress(Exception):
-                    await player.destroy(cleanup_voice=False)
-                    if guild.id in self.salad.players:
-                        del self.salad.players[guild.id]
+                await asyncio.gather(
+                    player.destroy(cleanup_voice=False),
+                    self.ensure_voice_disconnected(guild),
+                    return_exceptions=True
+                )
+                self.salad.players.pop(guild.id, None)
                 player = None
 
         if not player:
@@ -243,7 +340,7 @@ class Music(commands.Cog):
                     'guildId': guild.id,
                     'voiceChannel': user_channel.id,
                     'textChannel': interaction.channel.id,
-                    'selfDeaf' or 'deaf': True,
+                    'deaf': True,
                     'mute': False
                 })
             except Exception as e:
@@ -263,10 +360,8 @@ class Music(commands.Cog):
                 await player.destroy(cleanup_voice=False)
                 return None
 
-            for _ in range(30):
-                if player.connected:
-                    return player
-                await asyncio.sleep(0.5)
+            if await player.waitForConnection(timeout=15.0):
+                return player
 
             await interaction.followup.send('Connection timed out!', ephemeral=True)
             await self.ensure_voice_disconnected(guild)
@@ -278,7 +373,7 @@ class Music(commands.Cog):
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
         """Handle bot disconnection from voice."""
-        if member.id != (self.bot.user.id if self.bot.user else 0):
+        if member.id != self._bot_user_id or not self.salad:
             return
 
         if before.channel and not after.channel:
@@ -286,12 +381,13 @@ class Music(commands.Cog):
             await asyncio.sleep(1.0)
 
             if not guild.voice_client or not guild.voice_client.is_connected():
-                if self.salad:
-                    player = self.salad.players.get(guild.id)
-                    if player and not player.destroyed:
-                        await player.destroy(cleanup_voice=False)
+                salad = self.salad
+                player = salad.players.get(guild.id) if salad else None
+                if player and not player.destroyed:
+                    await player.destroy(cleanup_voice=False)
 
     @app_commands.command(name='join', description='Join a voice channel')
+    @guild_only_check()
     async def join(self, interaction: discord.Interaction, channel: Optional[discord.VoiceChannel] = None):
         """Join a voice channel."""
         if not channel:
@@ -309,21 +405,12 @@ class Music(commands.Cog):
             await interaction.followup.send(f'Joined **{channel.name}**')
 
     @app_commands.command(name='leave', description='Leave voice channel')
+    @guild_only_check()
     async def leave(self, interaction: discord.Interaction):
         """Disconnect from voice channel."""
-        if not interaction.guild:
-            return await interaction.response.send_message(
-                'This command must be used in a server!',
-                ephemeral=True
-            )
-
-        player = self.salad.players.get(interaction.guild.id) if self.salad else None
-
-        if not player or player.destroyed:
-            return await interaction.response.send_message(
-                'Not connected to a voice channel!',
-                ephemeral=True
-            )
+        player = await self._get_active_player(interaction, missing_msg='Not connected to a voice channel!')
+        if not player:
+            return
 
         await interaction.response.defer()
 
@@ -332,6 +419,7 @@ class Music(commands.Cog):
             await interaction.followup.send('Disconnected!')
 
     @app_commands.command(name='play', description='Play a song')
+    @guild_only_check()
     @app_commands.describe(query='Song name or URL')
     async def play(self, interaction: discord.Interaction, query: str):
         """Play a song or playlist."""
@@ -346,89 +434,89 @@ class Music(commands.Cog):
         except Exception as e:
             return await interaction.followup.send(f'Search failed: {str(e)}')
 
-        load_type = result.get('loadType', 'empty')
+        was_playing = player.playing
+        handler = self._load_handlers.get(result.get('loadType', 'empty'), self._handle_unknown)
+        if not await handler(interaction, result, player, query):
+            return
+
+        if not was_playing:
+            with suppress(Exception):
+                await player.play()
 
-        if load_type == 'empty':
-            return await interaction.followup.send(f'No results found for: `{query}`')
+    async def _handle_empty(self, interaction, result, player, query) -> bool:
+        await interaction.followup.send(f'No results found for: `{query}`')
+        return False
 
-        if load_type == 'error':
-            error_msg = result.get('exception', {})
-            if isinstance(error_msg, dict):
-                error_msg = error_msg.get('message', 'Unknown error')
-            return await interaction.followup.send(f'Error loading track: {error_msg}')
+    async def _handle_error(self, interaction, result, player, query) -> bool:
+        error_msg = result.get('exception', {})
+        if isinstance(error_msg, dict):
+            error_msg = error_msg.get('message', 'Unknown error')
+        await interaction.followup.send(f'Error loading track: {error_msg}')
+        return False
 
-        tracks = result.get('tracks', [])
+    async def _handle_playlist(self, interaction, result, player, query) -> bool:
+        tracks = result.get('tracks')
         if not tracks:
-            return await interaction.followup.send('No tracks found!')
+            await interaction.followup.send('No tracks found!')
+            return False
 
-        was_playing = player.playing
+        added_count = player.queue.extend(tracks)
+        if added_count == 0:
+            await interaction.followup.send('Failed to add tracks!')
+            return False
 
-        if load_type == 'playlist':
-            added_count = sum(1 for track in tracks if player.queue.add(track))
+        playlist_info = result.get('playlistInfo', {})
+        playlist_name = playlist_info.get('name', 'Unknown Playlist')
+
+        await interaction.followup.send(
+            f'Added **{added_count}** tracks from **{playlist_name}** to queue'
+        )
+        return True
 
-            if added_count == 0:
-                return await interaction.followup.send('Failed to add tracks!')
+    async def _handle_track(self, interaction, result, player, query) -> bool:
+        tracks = result.get('tracks')
+        if not tracks:
+            await interaction.followup.send('No tracks found!')
+            return False
 
-            playlist_info = result.get('playlistInfo', {})
-            playlist_name = playlist_info.get('name', 'Unknown Playlist')
+        track = tracks[0]
+        if not player.queue.add(track):
+            await interaction.followup.send('Failed to add track!')
+            return False
 
+        if player.playing:
             await interaction.followup.send(
-                f'Added **{added_count}** tracks from **{playlist_name}** to queue'
+                f'Added to queue: **{track.title}** by **{track.author}** (Position: {len(player.queue)})'
             )
-
-        elif load_type in ['track', 'search']:
-            track = tracks[0]
-
-            if not player.queue.add(track):
-                return await interaction.followup.send('Failed to add track!')
-
-            if was_playing:
-                position = len(player.queue)
-                await interaction.followup.send(
-                    f'Added to queue: **{track.title}** by **{track.author}** (Position: {position})'
-                )
-            else:
-                await interaction.followup.send(
-                    f'Now playing: **{track.title}** by **{track.author}**'
-                )
         else:
-            return await interaction.followup.send(f'Unknown load type: {load_type}')
+            await interaction.followup.send(
+                f'Now playing: **{track.title}** by **{track.author}**'
+            )
+        return True
 
-        if not was_playing:
-            with suppress(Exception):
-                await player.play()
+    async def _handle_unknown(self, interaction, result, player, query) -> bool:
+        await interaction.followup.send(f"Unknown load type: {result.get('loadType')}")
+        return False
 
     @app_commands.command(name='skip', description='Skip current track')
+    @guild_only_check()
     async def skip(self, interaction: discord.Interaction):
         """Skip the currently playing song."""
-        if not interaction.guild:
-            return await interaction.response.send_message(
-                'This command must be used in a server!',
-                ephemeral=True
-            )
-
-        player = self.salad.players.get(interaction.guild.id) if self.salad else None
-
-        if not player or player.destroyed or not player.current:
-            return await interaction.response.send_message('Nothing playing!', ephemeral=True)
+        player = await self._get_active_player(interaction, require_current=True)
+        if not player:
+            return
 
         with suppress(Exception):
             await player.skip()
             await interaction.response.send_message('⏭️ Skipped!')
 
     @app_commands.command(name='stop', description='Stop playback and clear queue')
+    @guild_only_check()
     async def stop(self, interaction: discord.Interaction):
         """Stop playback and clear the queue."""
-        if not interaction.guild:
-            return await interaction.response.send_message(
-                'This command must be used in a server!',
-                ephemeral=True
-            )
-
-        player = self.salad.players.get(interaction.guild.id) if self.salad else None
-
-        if not player or player.destroyed:
-            return await interaction.response.send_message('No active player!', ephemeral=True)
+        player = await self._get_active_player(interaction)
+        if not player:
+            return
 
         await interaction.response.defer()
 
@@ -437,18 +525,12 @@ class Music(commands.Cog):
             await interaction.followup.send('⏹️ Stopped and disconnected!')
 
     @app_commands.command(name='pause', description='Pause playback')
+    @guild_only_check()
     async def pause(self, interaction: discord.Interaction):
         """Pause the currently playing song."""
-        if not interaction.guild:
-            return await interaction.response.send_message(
-                'This command must be used in a server!',
-                ephemeral=True
-            )
-
-        player = self.salad.players.get(interaction.guild.id) if self.salad else None
-
-        if not player or player.destroyed:
-            return await interaction.response.send_message('No active player!', ephemeral=True)
+        player = await self._get_active_player(interaction)
+        if not player:
+            return
 
         if player.paused:
             return await interaction.response.send_message('Already paused!', ephemeral=True)
@@ -458,18 +540,12 @@ class Music(commands.Cog):
             await interaction.response.send_message('⏸️ Paused!')
 
     @app_commands.command(name='resume', description='Resume playback')
+    @guild_only_check()
     async def resume(self, interaction: discord.Interaction):
         """Resume the currently paused song."""
-        if not interaction.guild:
-            return await interaction.response.send_message(
-                'This command must be used in a server!',
-                ephemeral=True
-            )
-
-        player = self.salad.players.get(interaction.guild.id) if self.salad else None
-
-        if not player or player.destroyed:
-            return await interaction.response.send_message('No active player!', ephemeral=True)
+        player = await self._get_active_player(interaction)
+        if not player:
+            return
 
         if not player.paused:
             return await interaction.response.send_message('Not paused!', ephemeral=True)
@@ -479,48 +555,38 @@ class Music(commands.Cog):
             await interaction.response.send_message('▶️ Resumed!')
 
     @app_commands.command(name='volume', description='Set player volume')
+    @guild_only_check()
     @app_commands.describe(volume='Volume level (1-100)')
     async def volume(self, interaction: discord.Interaction, volume: int):
         """Change the player volume."""
-        if not interaction.guild:
-            return await interaction.response.send_message(
-                'This command must be used in a server!',
-                ephemeral=True
-            )
-
         if not 1 <= volume <= 100:
             return await interaction.response.send_message(
                 'Volume must be between 1 and 100!',
                 ephemeral=True
             )
 
-        player = self.salad.players.get(interaction.guild.id) if self.salad else None
-
-        if not player or player.destroyed:
-            return await interaction.response.send_message('No active player!', ephemeral=True)
+        player = await self._get_active_player(interaction)
+        if not player:
+            return
 
         with suppress(Exception):
             await player.setVolume(volume)
             await interaction.response.send_message(f'🔊 Volume set to **{volume}%**')
 
     @app_commands.command(name='queue', description='View the current queue')
+    @guild_only_check()
     async def queue(self, interaction: discord.Interaction):
         """Display the current queue."""
-        if not interaction.guild:
-            return await interaction.response.send_message(
-                'This command must be used in a server!',
-                ephemeral=True
-            )
-
-        player = self.salad.players.get(interaction.guild.id) if self.salad else None
-
-        if not player or player.destroyed:
-            return await interaction.response.send_message('No active player!', ephemeral=True)
+        player = await self._get_active_player(interaction)
+        if not player:
+            return
 
-        if not player.current and player.queue.isEmpty():
+        queue = player.queue
+        q_len = len(queue)
+        if not player.current and not q_len:
             return await interaction.response.send_message('Queue is empty!', ephemeral=True)
 
-        embed = discord.Embed(title='Queue', color=discord.Color.blue())
+        embed = discord.Embed(title='Queue', color=_BLUE)
 
         if player.current:
             embed.add_field(
@@ -529,41 +595,37 @@ class Music(commands.Cog):
                 inline=False
             )
 
-        if not player.queue.isEmpty():
-            queue_list = []
-            for i, track in enumerate(player.queue[:10], 1):
-                queue_list.append(f'`{i}.` **{track.title}** by **{track.author}**')
+        if q_len:
+            head = [queue.peek(i) for i in range(min(q_len, 10))]
+            body = '\n'.join(
+                f'`{i}.` **{track.title}** by **{track.author}**'
+                for i, track in enumerate(head, 1)
+            )
 
-            if len(player.queue) > 10:
-                queue_list.append(f'\n*And {len(player.queue) - 10} more...*')
+            if q_len > 10:
+                body += f'\n\n*And {q_len - 10} more...*'
 
             embed.add_field(
-                name=f'Up Next ({len(player.queue)} tracks)',
-                value='\n'.join(queue_list),
+                name=f'Up Next ({q_len} tracks)',
+                value=body,
                 inline=False
             )
 
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name='nowplaying', description='Show currently playing song')
+    @guild_only_check()
     async def nowplaying(self, interaction: discord.Interaction):
         """Display the currently playing song."""
-        if not interaction.guild:
-            return await interaction.response.send_message(
-                'This command must be used in a server!',
-                ephemeral=True
-            )
-
-        player = self.salad.players.get(interaction.guild.id) if self.salad else None
-
-        if not player or player.destroyed or not player.current:
-            return await interaction.response.send_message('Nothing playing!', ephemeral=True)
+        player = await self._get_active_player(interaction, require_current=True)
+        if not player:
+            return
 
         track = player.current
         embed = discord.Embed(
             title='Now Playing',
             description=f'**{track.title}** by **{track.author}**',
-            color=discord.Color.green()
+            color=_GREEN
         )
 
         if hasattr(track, 'uri'):
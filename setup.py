@@ -12,10 +12,12 @@ setup(
     python_requires='>=3.8',
     install_requires=[
         'aiohttp',
+        'multidict',
+        'yarl',
     ],
     extras_require={
         'fast': ['orjson', 'msgpack', 'aiofiles'],  
-        'speed': ['ujson'],  
+        'speed': ['ujson', 'uvloop; sys_platform != "win32"'],  
     },
     author='ToddyTheNoobDud',
     url='https://github.com/ToddyTheNoobDud/Salad',